@@ -1,11 +1,24 @@
+import logging
 import sys
+import time
+
+STARTUP_STARTED = time.perf_counter()
+
 from PyQt5 import QtWidgets, QtGui, QtCore
 from config.settings_manager import SettingsManager
 from tabs.dashboard_tab import DashboardTab
-from tabs.casino_manager_tab import CasinoManagerTab
+from tabs.diagnostics_tab import DiagnosticsTab
+from tabs.lazy_tab import LazyTab
 from tabs.settings_tab import SettingsTab
-from tabs.youtube_watcher_tab import YouTubeWatcherTab
+from utils import api_client
+from utils.api_client import APIClient
+from utils.casino_catalog import CasinoCatalog
 from utils.logger import Logger
+from utils.logging_setup import configure_logging, set_log_level, shutdown_logging
+from utils.metrics import DEFAULT_METRICS_PORT, MetricsServer
+from utils.settings_values import int_setting
+
+logger = logging.getLogger('Startup')
 
 
 class CustomTitleBar(QtWidgets.QWidget):
@@ -54,6 +67,8 @@ class CustomTitleBar(QtWidgets.QWidget):
 
 
 class GamblerSettingsApp(QtWidgets.QMainWindow):
+    settings_changed = QtCore.pyqtSignal(dict)
+
     def __init__(self):
         super().__init__()
 
@@ -65,6 +80,8 @@ class GamblerSettingsApp(QtWidgets.QMainWindow):
 
         self.settings_manager = SettingsManager("settings.json")
         self.settings = self.settings_manager.load()
+        configure_logging(self.settings.get('log_level', ''))
+        self.settings_changed.connect(lambda settings: set_log_level(settings.get('log_level', '')))
 
         self.central_widget = QtWidgets.QWidget()
         self.setCentralWidget(self.central_widget)
@@ -76,21 +93,76 @@ class GamblerSettingsApp(QtWidgets.QMainWindow):
 
         self.status_log = Logger()
 
+        self.casino_catalog = CasinoCatalog(APIClient(self.settings), parent=self)
+
         self.tab_control = QtWidgets.QTabWidget()
         layout.addWidget(self.tab_control)
 
+        # Heavy tabs are placeholders until activated or until the first paint has happened
         self.dashboard_tab = DashboardTab(self)
-        self.casino_manager_tab = CasinoManagerTab(self)
-        self.youtube_watcher_tab = YouTubeWatcherTab(self)
+        self.casino_manager_tab = LazyTab('Casino Manager', self.build_casino_manager_tab)
+        self.youtube_watcher_tab = LazyTab('YouTube Watcher', self.build_youtube_watcher_tab)
         self.settings_tab = SettingsTab(self)
+        self.diagnostics_tab = DiagnosticsTab(self)
+        self.casino_catalog.refresh()
 
         self.tab_control.addTab(self.dashboard_tab, 'Dashboard')
         self.tab_control.addTab(self.casino_manager_tab, 'Casino Manager')
         self.tab_control.addTab(self.youtube_watcher_tab, 'YouTube Watcher')
         self.tab_control.addTab(self.settings_tab, 'Settings')
+        self.tab_control.addTab(self.diagnostics_tab, 'Diagnostics')
+        self.tab_control.currentChanged.connect(self.on_tab_changed)
         layout.addWidget(self.status_log)
 
+        self.metrics_server = MetricsServer(
+            port=int_setting(self.settings, 'metrics_port', DEFAULT_METRICS_PORT, maximum=65535))
+        try:
+            self.metrics_server.start()
+            self.diagnostics_tab.set_endpoint(self.metrics_server.url)
+        except OSError as e:
+            self.log_status(f"Failed to start metrics endpoint: {e}")
+
         self.drag_pos = None
+        self.first_paint_done = False
+        self.log_startup_phase("main window built")
+
+    def log_startup_phase(self, phase):
+        elapsed = (time.perf_counter() - STARTUP_STARTED) * 1000
+        logger.info(f"Startup: {phase} at {elapsed:.0f} ms")
+        self.log_status(f"Startup: {phase} at {elapsed:.0f} ms")
+
+    def build_casino_manager_tab(self):
+        from tabs.casino_manager_tab import CasinoManagerTab
+        return CasinoManagerTab(self)
+
+    def build_youtube_watcher_tab(self):
+        # The watcher imports QtWebEngine (and starts Chromium) when the browser chat backend is used
+        from tabs.youtube_watcher_tab import YouTubeWatcherTab
+        return YouTubeWatcherTab(self)
+
+    def on_tab_changed(self, index):
+        page = self.tab_control.widget(index)
+        if isinstance(page, LazyTab):
+            page.materialize()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            # Armed during the first paint, the timer fires once that frame has been painted
+            QtCore.QTimer.singleShot(0, self.on_first_paint)
+
+    def on_first_paint(self):
+        self.log_startup_phase("first paint")
+        # The watcher tracks chat and awards points even while hidden, so build it right away;
+        # yield to the event loop between tabs to keep the window responsive.
+        QtCore.QTimer.singleShot(0, lambda: self.materialize_in_background(self.youtube_watcher_tab))
+        QtCore.QTimer.singleShot(0, lambda: self.materialize_in_background(self.casino_manager_tab))
+
+    def materialize_in_background(self, tab):
+        if tab.widget is None:
+            tab.materialize()
+            self.log_startup_phase(f"{tab.name} tab ready")
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
@@ -105,8 +177,20 @@ class GamblerSettingsApp(QtWidgets.QMainWindow):
     def mouseReleaseEvent(self, event):
         self.drag_pos = None
 
-    def log_status(self, message):
-        self.status_log.append_message(message)
+    def closeEvent(self, event):
+        # A lazy tab that was never opened has no workers to stop
+        if self.youtube_watcher_tab.widget is not None:
+            self.youtube_watcher_tab.widget.shutdown()
+        self.metrics_server.stop()
+        api_client.shutdown()
+        shutdown_logging()
+        super().closeEvent(event)
+
+    def log_status(self, message, level=None, exc_info=False):
+        if exc_info:
+            logger.error(message, exc_info=True)
+            level = logging.ERROR
+        self.status_log.append_message(message, level)
 
     def dark_theme(self):
         return """
@@ -124,7 +208,7 @@ class GamblerSettingsApp(QtWidgets.QMainWindow):
         QTabBar::tab:selected {
             background: #555;
         }
-        QTextEdit {
+        QTextEdit, QPlainTextEdit {
             background: #333;
             color: white;
             border: 1px solid #444;
@@ -157,6 +241,8 @@ class GamblerSettingsApp(QtWidgets.QMainWindow):
 
 
 if __name__ == '__main__':
+    # Required for QtWebEngine when it is imported after the QApplication exists
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
     app = QtWidgets.QApplication(sys.argv)
     window = GamblerSettingsApp()
     window.show()
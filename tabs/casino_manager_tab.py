@@ -2,6 +2,7 @@ from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QFileDialog, QTableWidget, QTableWidgetItem, QVBoxLayout, QPushButton, QLabel
 from utils.api_client import APIClient
+from utils.image_cache import get_image_cache
 import os
 
 class CasinoManagerTab(QtWidgets.QWidget):
@@ -9,6 +10,9 @@ class CasinoManagerTab(QtWidgets.QWidget):
         super().__init__()
         self.parent = parent
         self.api_client = APIClient(parent.settings)
+        self.catalog = parent.casino_catalog
+        self.catalog.changed.connect(self.on_casinos_loaded)
+        self.logo_requests = []
         self.init_ui()
 
     def init_ui(self):
@@ -65,8 +69,9 @@ class CasinoManagerTab(QtWidgets.QWidget):
         """)
         layout.addWidget(self.casino_table)
 
-        # Load existing casinos from API
-        self.load_casinos()
+        # Show the catalog if it is already loaded; later updates arrive through `changed`
+        if self.catalog.casinos:
+            self.on_casinos_loaded(self.catalog.casinos)
 
     def browse_logo_file(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Select Logo File", "", "Image Files (*.png *.jpg *.jpeg)")
@@ -85,55 +90,62 @@ class CasinoManagerTab(QtWidgets.QWidget):
 
         try:
             with open(logo_path, "rb") as logo_file:
-                files = {"image": (os.path.basename(logo_path), logo_file, "image/png")}
-                data = {"name": name, "url": url}
-
-                response = self.api_client.post("add-casino", data=data, files=files)
-
-            # Handle cases where response is None
-            if response is None:
-                self.parent.log_status("Error: No response from API.")
-                return
-
-            # Handle error messages from API
-            if "error" in response:
-                self.parent.log_status(f"Error: {response['error']}")
-                return
-
-            # Success response
-            if response.get("success"):
-                self.parent.log_status(f"Casino '{name}' added successfully.")
-                self.load_casinos()  # Refresh table
-            else:
-                self.parent.log_status("Error: Unexpected API response.")
-
+                logo_data = logo_file.read()
         except Exception as e:
-            self.parent.log_status(f"Error: Failed to upload image - {e}")
+            self.parent.log_status(f"Error: Failed to read logo file - {e}")
+            return
 
-    def load_casinos(self):
-        """Fetch the list of casinos from the API and populate the table with images."""
-        self.casino_table.setRowCount(0)  # Clear previous table content
+        files = {"image": (os.path.basename(logo_path), logo_data, "image/png")}
+        data = {"name": name, "url": url}
+        self.api_client.post_async(
+            "add-casino",
+            data=data,
+            files=files,
+            callback=lambda response: self.on_casino_added(response, name),
+        )
+
+    def on_casino_added(self, response, name):
+        # Handle cases where response is None
+        if response is None:
+            self.parent.log_status("Error: No response from API.")
+            return
 
-        response = self.api_client.get("get-casinos")
-        if not response:
-            self.parent.log_status("Error: Unable to fetch casinos from API.")
+        # Handle error messages from API
+        if "error" in response:
+            self.parent.log_status(f"Error: {response['error']}")
             return
 
-        casinos = response.get("casinos", [])  # Extract the list of casinos
+        # Success response
+        if response.get("success"):
+            self.parent.log_status(f"Casino '{name}' added successfully.")
+            self.catalog.invalidate()  # Refresh table
+        else:
+            self.parent.log_status("Error: Unexpected API response.")
+
+    def on_casinos_loaded(self, casinos):
+        """Populate the table; cached logos show at once, the rest are fetched in parallel and filled in as they arrive."""
+        for request in self.logo_requests:
+            request.cancel()
+        self.logo_requests = []
+        self.casino_table.setRowCount(0)  # Clear previous table content
 
         for row_idx, casino in enumerate(casinos):
             self.casino_table.insertRow(row_idx)
 
-            # Casino Logo - Load and Display Image
+            # Casino Logo - filled in when the image arrives
             logo_label = QLabel()
+            logo_label.setAlignment(QtCore.Qt.AlignCenter)
             logo_url = casino.get("logo", "")
             if logo_url:
-                pixmap = QPixmap()
-                pixmap.loadFromData(self.api_client.get_url(logo_url, return_raw=True))  # Load image data
-                pixmap = pixmap.scaled(80, 50)  # Resize for table cell
-
-                logo_label.setPixmap(pixmap)
-                logo_label.setAlignment(QtCore.Qt.AlignCenter)
+                # Show the cached copy right away, then revalidate it in the background
+                cached = get_image_cache().cached(logo_url)
+                if cached:
+                    self.set_logo(logo_label, cached)
+                self.logo_requests.append(self.api_client.get_image_async(
+                    logo_url,
+                    callback=lambda result, label=logo_label, warm=bool(cached): self.on_logo_fetched(
+                        label, result, warm),
+                ))
 
             self.casino_table.setCellWidget(row_idx, 0, logo_label)
 
@@ -148,3 +160,17 @@ class CasinoManagerTab(QtWidgets.QWidget):
             self.casino_table.setItem(row_idx, 2, url_item)
 
         self.parent.log_status("Casinos loaded successfully.")
+
+    def on_logo_fetched(self, logo_label, result, warm):
+        if not result:
+            return
+        content, modified = result
+        if modified or not warm:
+            self.set_logo(logo_label, content)
+
+    def set_logo(self, logo_label, content):
+        if not content:
+            return
+        pixmap = QPixmap()
+        pixmap.loadFromData(content)  # Load image data
+        logo_label.setPixmap(pixmap.scaled(80, 50))  # Resize for table cell
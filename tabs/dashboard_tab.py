@@ -1,6 +1,5 @@
 import os
 
-import requests
 from PyQt5 import QtWidgets
 from utils.api_client import APIClient  # Import API Client to fetch casinos
 
@@ -9,6 +8,9 @@ class DashboardTab(QtWidgets.QWidget):
         super().__init__()
         self.parent = parent
         self.api_client = APIClient(parent.settings)
+        self.catalog = parent.casino_catalog
+        self.catalog.changed.connect(self.on_casinos_loaded)
+        self.catalog.fetch_failed.connect(self.on_casinos_failed)
         self.init_ui()
         self.load_settings()
 
@@ -46,17 +48,19 @@ class DashboardTab(QtWidgets.QWidget):
         layout.addWidget(spin_button, 4, 1)
 
     def load_casinos_from_api(self):
-        """Fetch the casino list from API and populate the dropdown."""
-        self.casino_selector.clear()
-        response = self.api_client.get("get-casinos")  # API call
+        """Force a refresh of the shared casino catalog; the dropdown is repopulated when it answers."""
+        self.catalog.refresh(force=True)
 
-        if not response or "casinos" not in response:
-            self.parent.log_status("Error: Unable to fetch casinos from API.")
-            return
+    def on_casinos_failed(self):
+        self.parent.log_status("Error: Unable to fetch casinos from API.")
 
-        casinos = response["casinos"]
+    def on_casinos_loaded(self, casinos):
+        selected_casino = self.casino_selector.currentText() or self.parent.settings.get("selected_casino", "")
+        self.casino_selector.clear()
         for casino in casinos:
             self.casino_selector.addItem(casino["name"])
+        if selected_casino:
+            self.casino_selector.setCurrentText(selected_casino)
 
         self.parent.log_status("Casino list updated successfully.")
 
@@ -85,10 +89,9 @@ class DashboardTab(QtWidgets.QWidget):
         else:
             self.parent.log_status("Deposit file not found. Set it in the Settings tab.")
 
-        # Load casinos from API
-        self.load_casinos_from_api()
-
-    import requests
+        # Populate from the catalog if it is already loaded; otherwise it fills in on `changed`
+        if self.catalog.casinos:
+            self.on_casinos_loaded(self.catalog.casinos)
 
     def save_config(self):
         """Save the offer and deposit values and download the selected casino's logo."""
@@ -119,34 +122,33 @@ class DashboardTab(QtWidgets.QWidget):
             self.parent.log_status(f"Failed to save deposit: {e}")
             return
 
-        # Fetch selected casino details from the API
-        response = self.api_client.get("get-casinos")
-        if not response or "casinos" not in response:
-            self.parent.log_status("Error: Unable to fetch casinos from API.")
-            return
-
-        casinos = response["casinos"]
-        selected_casino_data = next((c for c in casinos if c["name"] == selected_casino), None)
+        # Look up the selected casino in the catalog, then download its logo
+        selected_casino_data = self.catalog.get(selected_casino)
 
         if not selected_casino_data or "logo" not in selected_casino_data:
             self.parent.log_status("Error: Casino logo not found.")
             return
 
         logo_url = selected_casino_data["logo"]  # Casino logo URL from API
+        self.api_client.get_image_async(
+            logo_url,
+            callback=lambda result: self.on_save_logo_downloaded(result, selected_casino),
+        )
+
+    def on_save_logo_downloaded(self, result, selected_casino):
+        content = result[0] if result else None
+        # Save the casino logo as play_on_casino.png
+        if content is None:
+            self.parent.log_status("Error: Failed to download casino logo.")
+        else:
+            try:
+                with open("play_on_casino.png", "wb") as file:
+                    file.write(content)
 
-        # Download and save the casino logo as play_on_casino.png
-        try:
-            logo_response = requests.get(logo_url, stream=True)
-            logo_response.raise_for_status()
-
-            with open("play_on_casino.png", "wb") as file:
-                for chunk in logo_response.iter_content(1024):
-                    file.write(chunk)
-
-            self.parent.log_status(f"Casino image saved as play_on_casino.png")
+                self.parent.log_status(f"Casino image saved as play_on_casino.png")
 
-        except Exception as e:
-            self.parent.log_status(f"Error: Failed to download casino logo - {e}")
+            except Exception as e:
+                self.parent.log_status(f"Error: Failed to save casino logo - {e}")
 
         # Save selected casino in settings
         self.parent.settings["selected_casino"] = selected_casino
@@ -161,9 +163,10 @@ class DashboardTab(QtWidgets.QWidget):
             self.parent.log_status("Spin URL not configured.")
             return
 
-        try:
-            import requests
-            response = requests.get(spin_url)
-            self.parent.log_status(f"Spin request sent. Response: {response.status_code}")
-        except Exception as e:
-            self.parent.log_status(f"Failed to send spin request: {e}")
+        self.api_client.get_url_async(spin_url, return_raw=True, callback=self.on_spin_sent)
+
+    def on_spin_sent(self, content):
+        if content is None:
+            self.parent.log_status("Failed to send spin request.")
+        else:
+            self.parent.log_status("Spin request sent.")
@@ -0,0 +1,82 @@
+import time
+
+from PyQt5 import QtWidgets, QtCore
+
+from utils.metrics import METRICS, STAGES
+
+REFRESH_INTERVAL_MS = 1000
+COLUMNS = ("Stage", "Runs", "Items", "Items/s", "Mean ms", "p50 ms", "p95 ms", "p99 ms")
+
+
+def format_ms(seconds):
+    if seconds is None:
+        return "-"
+    if seconds == float("inf"):
+        return "> 10000"
+    return f"{seconds * 1000:.1f}"
+
+
+class DiagnosticsTab(QtWidgets.QWidget):
+    """
+    Per-stage pipeline metrics: run and item counts, the current item rate and
+    latency percentiles (bucket upper bounds). Refreshed once a second while
+    the tab is visible; the same numbers are served at the /metrics endpoint.
+    """
+
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+        self.last_items = {}
+        self.last_refresh = time.monotonic()
+        self.init_ui()
+
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def init_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.endpoint_label = QtWidgets.QLabel("Metrics endpoint: not running")
+        self.endpoint_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        layout.addWidget(self.endpoint_label)
+
+        self.table = QtWidgets.QTableWidget(len(STAGES), len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        for row, (name, description) in enumerate(STAGES):
+            item = QtWidgets.QTableWidgetItem(name)
+            item.setToolTip(description)
+            self.table.setItem(row, 0, item)
+            for column in range(1, len(COLUMNS)):
+                self.table.setItem(row, column, QtWidgets.QTableWidgetItem("-"))
+        layout.addWidget(self.table)
+
+    def set_endpoint(self, url):
+        self.endpoint_label.setText(f"Metrics endpoint: {url}" if url else "Metrics endpoint: not running")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        now = time.monotonic()
+        elapsed = max(now - self.last_refresh, 1e-6)
+        self.last_refresh = now
+        snapshot = METRICS.snapshot()
+        for row, (name, _) in enumerate(STAGES):
+            count, items, total_seconds, p50, p95, p99 = snapshot[name]
+            rate = (items - self.last_items.get(name, items)) / elapsed
+            self.last_items[name] = items
+            mean = total_seconds / count if count else None
+            values = (str(count), str(items), f"{rate:.1f}", format_ms(mean),
+                      format_ms(p50), format_ms(p95), format_ms(p99))
+            for column, value in enumerate(values, start=1):
+                self.table.item(row, column).setText(value)
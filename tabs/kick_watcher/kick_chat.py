@@ -0,0 +1,174 @@
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+
+import requests
+from PyQt5 import QtCore
+
+from utils.metrics import METRICS
+
+try:
+    import websockets
+except ImportError:  # optional: only needed when a Kick channel is configured
+    websockets = None
+
+logger = logging.getLogger('KickChat')
+
+KICK_API_BASE = "https://kick.com/api/v2"
+KICK_PUSHER_URL = "wss://ws-us2.pusher.com/app/32cbd69e4b950bf97679?protocol=7&client=js&version=8.4.0&flash=false"
+CHAT_MESSAGE_EVENT = "App\\Events\\ChatMessageEvent"
+PLATFORM = "kick"
+REQUEST_TIMEOUT = (3.05, 10)
+MAX_RECONNECT_SECONDS = 60
+FLUSH_SECONDS = 0.05
+EMOTE_RE = re.compile(r"\[emote:\d+:([^\]]*)\]")
+
+
+def resolve_chatroom_id(channel, api_base=KICK_API_BASE):
+    """Return the chatroom id for a channel slug; a numeric channel is taken as the chatroom id itself."""
+    if channel.isdigit():
+        return int(channel)
+    response = requests.get(f"{api_base.rstrip('/')}/channels/{channel}", timeout=REQUEST_TIMEOUT,
+                            headers={"Accept": "application/json"})
+    response.raise_for_status()
+    return response.json()["chatroom"]["id"]
+
+
+def created_at_usec(created_at):
+    try:
+        return str(int(datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp() * 1_000_000))
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_chat_message(data):
+    """Turn a Kick ChatMessageEvent payload into the record format the YouTube bridge pushes."""
+    sender = data.get("sender") or {}
+    badges = [badge.get("type", "") for badge in (sender.get("identity") or {}).get("badges", [])]
+    return {
+        "platform": PLATFORM,
+        "message_id": f"{PLATFORM}:{data['id']}",
+        "channel_id": f"{PLATFORM}:{sender['id']}" if sender.get("id") is not None else None,
+        "author": sender.get("username") or "Unknown",
+        "message": EMOTE_RE.sub(r"\1", data.get("content") or ""),
+        "badges": ["member" if badge in ("subscriber", "founder", "og") else badge for badge in badges],
+        "timestamp_usec": created_at_usec(data.get("created_at")),
+    }
+
+
+class KickChatClient(QtCore.QObject):
+    """
+    Receives a Kick channel's chat over Kick's Pusher WebSocket on an asyncio
+    loop in a background thread, reconnecting with backoff. Records are
+    emitted through ``messages_received`` in the YouTube bridge format with a
+    ``platform`` of "kick", and ids are prefixed so they cannot collide with
+    YouTube ones. Messages arriving within FLUSH_SECONDS are emitted together.
+    """
+
+    messages_received = QtCore.pyqtSignal(list)
+    status_changed = QtCore.pyqtSignal(str)
+
+    def __init__(self, channel, pusher_url=KICK_PUSHER_URL, api_base=KICK_API_BASE, parent=None):
+        super().__init__(parent)
+        self.channel = channel
+        self.pusher_url = pusher_url or KICK_PUSHER_URL
+        self.api_base = api_base or KICK_API_BASE
+        self.loop = None
+        self.stop_event = None
+        self.thread = None
+        self.stopping = False
+        self.pending = []
+
+    def start(self):
+        if websockets is None:
+            self.status_changed.emit("Kick chat needs the 'websockets' package (pip install websockets)")
+            return
+        self.thread = threading.Thread(target=self.run, name="KickChat", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Ask the client to disconnect. Does not wait: the daemon thread exits on its own."""
+        self.stopping = True
+        if self.loop is not None and self.stop_event is not None:
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+        self.thread = None
+
+    def run(self):
+        asyncio.run(self.main())
+
+    async def main(self):
+        self.stop_event = asyncio.Event()
+        self.loop = asyncio.get_running_loop()
+        # A stop() that ran before the event existed could not signal it
+        if self.stopping:
+            self.stop_event.set()
+        delay = 1
+        while not self.stopping:
+            try:
+                chatroom_id = await asyncio.to_thread(resolve_chatroom_id, self.channel, self.api_base)
+                if self.stopping:
+                    break
+                await self.listen(chatroom_id)
+                delay = 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Kick chat connection failed: {e}")
+                self.status_changed.emit(f"Kick chat disconnected: {e}")
+            if self.stopping:
+                break
+            try:
+                await asyncio.wait_for(self.stop_event.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(MAX_RECONNECT_SECONDS, delay * 2)
+
+    async def listen(self, chatroom_id):
+        async with websockets.connect(self.pusher_url) as socket:
+            await socket.send(json.dumps({
+                "event": "pusher:subscribe",
+                "data": {"auth": "", "channel": f"chatrooms.{chatroom_id}.v2"},
+            }))
+            stop_task = asyncio.ensure_future(self.stop_event.wait())
+            try:
+                while not self.stopping:
+                    receive_task = asyncio.ensure_future(socket.recv())
+                    done, _ = await asyncio.wait({receive_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+                    if stop_task in done:
+                        receive_task.cancel()
+                        return
+                    await self.handle_frame(socket, receive_task.result(), chatroom_id)
+            finally:
+                stop_task.cancel()
+
+    async def handle_frame(self, socket, frame, chatroom_id):
+        started = time.perf_counter()
+        message = json.loads(frame)
+        event = message.get("event")
+        if event == "pusher:ping":
+            await socket.send(json.dumps({"event": "pusher:pong", "data": {}}))
+        elif event == "pusher_internal:subscription_succeeded":
+            logger.info(f"Subscribed to Kick chatroom {chatroom_id}")
+            self.status_changed.emit(f"Kick chat connected: {self.channel}")
+        elif event == CHAT_MESSAGE_EVENT:
+            data = message.get("data")
+            if isinstance(data, str):
+                data = json.loads(data)
+            try:
+                record = parse_chat_message(data)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed Kick chat message: {e}")
+                return
+            METRICS.observe("payload_parse", time.perf_counter() - started)
+            if not self.pending:
+                self.loop.call_later(FLUSH_SECONDS, self.flush)
+            self.pending.append(record)
+
+    def flush(self):
+        records, self.pending = self.pending, []
+        if records and not self.stopping:
+            self.messages_received.emit(records)
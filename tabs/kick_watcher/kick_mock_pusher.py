@@ -0,0 +1,121 @@
+"""
+Local stand-in for Kick's Pusher WebSocket, for testing Kick chat ingestion
+offline. Accepts subscriptions to ``chatrooms.<id>.v2`` and broadcasts
+generated (or JSON-lines file) chat messages to them. Set ``kick_pusher_url``
+to the printed URL and use a numeric ``kick_channel`` as the chatroom id, e.g.
+
+    python -m tabs.kick_watcher.kick_mock_pusher --port 8768 --rate 5
+
+Requires the optional ``websockets`` package.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import uuid
+from datetime import datetime, timezone
+
+import websockets
+
+from tabs.kick_watcher.kick_chat import CHAT_MESSAGE_EVENT
+
+logger = logging.getLogger('KickMockPusher')
+
+DEFAULT_MOCK_PORT = 8768
+
+
+def generated_messages():
+    words = ["hello", "gg", "spin", "bonus", "lets go", "nice win", "[emote:37226:KEKW]"]
+    while True:
+        yield {"author": f"kicker{random.randint(1, 100)}", "message": random.choice(words)}
+
+
+def chat_event(chatroom_id, message, sender_ids):
+    author = message.get("author", "Unknown")
+    sender_id = sender_ids.setdefault(author, len(sender_ids) + 1)
+    badges = [{"type": badge, "text": badge} for badge in message.get("badges", [])]
+    data = {
+        "id": str(uuid.uuid4()),
+        "chatroom_id": chatroom_id,
+        "content": message.get("message", ""),
+        "type": "message",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "sender": {"id": sender_id, "username": author, "slug": author.lower(),
+                   "identity": {"color": "#FFFFFF", "badges": badges}},
+    }
+    return json.dumps({"event": CHAT_MESSAGE_EVENT, "data": json.dumps(data),
+                       "channel": f"chatrooms.{chatroom_id}.v2"})
+
+
+class MockPusherServer:
+    def __init__(self, messages=None, rate=5.0, port=DEFAULT_MOCK_PORT, host="127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.source = iter(messages) if messages is not None else generated_messages()
+        self.subscribers = {}  # websocket -> chatroom id
+        self.sender_ids = {}
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}/app/mock?protocol=7"
+
+    async def handle(self, socket, *args):
+        await socket.send(json.dumps({
+            "event": "pusher:connection_established",
+            "data": json.dumps({"socket_id": uuid.uuid4().hex, "activity_timeout": 120}),
+        }))
+        try:
+            async for frame in socket:
+                message = json.loads(frame)
+                if message.get("event") == "pusher:subscribe":
+                    channel = message["data"]["channel"]
+                    self.subscribers[socket] = int(channel.split(".")[1])
+                    await socket.send(json.dumps({"event": "pusher_internal:subscription_succeeded",
+                                                  "data": "{}", "channel": channel}))
+                elif message.get("event") == "pusher:ping":
+                    await socket.send(json.dumps({"event": "pusher:pong", "data": {}}))
+        finally:
+            self.subscribers.pop(socket, None)
+
+    async def broadcast(self):
+        while True:
+            await asyncio.sleep(1 / self.rate)
+            message = next(self.source, None)
+            if message is None:
+                return
+            for socket, chatroom_id in list(self.subscribers.items()):
+                try:
+                    await socket.send(chat_event(chatroom_id, message, self.sender_ids))
+                except websockets.ConnectionClosed:
+                    self.subscribers.pop(socket, None)
+
+    async def serve(self):
+        async with websockets.serve(self.handle, self.host, self.port):
+            logger.info(f"Mock Kick Pusher served at {self.url}")
+            print(f"Set kick_pusher_url to {self.url}")
+            await self.broadcast()
+            await asyncio.Future()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock Kick Pusher WebSocket.")
+    parser.add_argument("--port", type=int, default=DEFAULT_MOCK_PORT)
+    parser.add_argument("--rate", type=float, default=5.0, help="messages per second")
+    parser.add_argument("--file", help="JSON-lines file of {author, message} objects; generated if omitted")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    messages = None
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            messages = [json.loads(line) for line in f if line.strip()]
+    try:
+        asyncio.run(MockPusherServer(messages, args.rate, args.port).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
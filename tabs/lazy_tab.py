@@ -0,0 +1,37 @@
+import logging
+import time
+
+from PyQt5 import QtWidgets
+
+logger = logging.getLogger('LazyTab')
+
+
+class LazyTab(QtWidgets.QWidget):
+    """
+    Placeholder page for a QTabWidget. The real tab is built by ``factory`` the
+    first time ``materialize`` is called, either when the page is activated or
+    from an idle callback after the window has painted. Factories should import
+    heavy modules themselves so the import cost is deferred too.
+    """
+
+    def __init__(self, name, factory, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.factory = factory
+        self.widget = None
+        self.page_layout = QtWidgets.QVBoxLayout(self)
+        self.page_layout.setContentsMargins(0, 0, 0, 0)
+        self.placeholder = QtWidgets.QLabel(f"Loading {name}...")
+        self.page_layout.addWidget(self.placeholder)
+
+    def materialize(self):
+        if self.widget is not None:
+            return self.widget
+        started = time.perf_counter()
+        self.widget = self.factory()
+        self.page_layout.removeWidget(self.placeholder)
+        self.placeholder.deleteLater()
+        self.placeholder = None
+        self.page_layout.addWidget(self.widget)
+        logger.info(f"{self.name} tab built in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self.widget
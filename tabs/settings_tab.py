@@ -1,5 +1,6 @@
-from PyQt5 import QtWidgets
+from PyQt5 import QtWidgets, QtGui
 from PyQt5.QtWidgets import QFileDialog
+from utils.logging_setup import DEFAULT_LEVEL, LOG_LEVELS
 
 class SettingsTab(QtWidgets.QWidget):
     def __init__(self, parent):
@@ -39,6 +40,10 @@ class SettingsTab(QtWidgets.QWidget):
         self.api_streamer_id_entry = QtWidgets.QLineEdit()
         layout.addRow("Streamer ID:", self.api_streamer_id_entry)
 
+        self.log_level_selector = QtWidgets.QComboBox()
+        self.log_level_selector.addItems(LOG_LEVELS)
+        layout.addRow("Log File Level:", self.log_level_selector)
+
         return api_settings
 
     def create_casino_settings(self):
@@ -81,6 +86,15 @@ class SettingsTab(QtWidgets.QWidget):
         self.yt_channel_entry = QtWidgets.QLineEdit()
         layout.addRow("YouTube Channel ID:", self.yt_channel_entry)
 
+        self.youtube_api_base_entry = QtWidgets.QLineEdit()
+        self.youtube_api_base_entry.setPlaceholderText("https://www.googleapis.com/youtube/v3")
+        layout.addRow("YouTube API Base URL:", self.youtube_api_base_entry)
+
+        self.youtube_daily_quota_entry = QtWidgets.QLineEdit()
+        self.youtube_daily_quota_entry.setPlaceholderText("10000")
+        self.youtube_daily_quota_entry.setValidator(QtGui.QIntValidator(1, 1000000000, self))
+        layout.addRow("YouTube Daily Quota:", self.youtube_daily_quota_entry)
+
         return youtube_settings
 
     def create_kick_settings(self):
@@ -90,6 +104,14 @@ class SettingsTab(QtWidgets.QWidget):
         self.kick_channel_entry = QtWidgets.QLineEdit()
         layout.addRow("Kick Channel:", self.kick_channel_entry)
 
+        self.kick_pusher_url_entry = QtWidgets.QLineEdit()
+        self.kick_pusher_url_entry.setPlaceholderText("Kick's Pusher WebSocket (default)")
+        layout.addRow("Kick Pusher URL:", self.kick_pusher_url_entry)
+
+        self.kick_api_base_entry = QtWidgets.QLineEdit()
+        self.kick_api_base_entry.setPlaceholderText("https://kick.com/api/v2")
+        layout.addRow("Kick API Base URL:", self.kick_api_base_entry)
+
         return kick_settings
 
     def create_chat_settings(self):
@@ -104,6 +126,51 @@ class SettingsTab(QtWidgets.QWidget):
         self.ignored_users_entry = QtWidgets.QLineEdit()
         layout.addRow("Ignored Users:", self.ignored_users_entry)
 
+        self.chat_backend_selector = QtWidgets.QComboBox()
+        self.chat_backend_selector.addItems(["browser", "http"])
+        self.chat_backend_selector.setToolTip("browser: embedded YouTube chat page; http: headless polling, no browser")
+        layout.addRow("Chat Backend:", self.chat_backend_selector)
+
+        self.youtube_web_base_entry = QtWidgets.QLineEdit()
+        self.youtube_web_base_entry.setPlaceholderText("https://www.youtube.com")
+        layout.addRow("YouTube Web Base URL:", self.youtube_web_base_entry)
+
+        self.dedup_bloom_checkbox = QtWidgets.QCheckBox("Also remember older message ids (Bloom filter)")
+        layout.addRow("Duplicate Filter:", self.dedup_bloom_checkbox)
+
+        self.hotword_window_messages_entry = QtWidgets.QLineEdit()
+        self.hotword_window_messages_entry.setPlaceholderText("100")
+        self.hotword_window_messages_entry.setValidator(QtGui.QIntValidator(1, 1000000, self))
+        layout.addRow("Hot-word Window (messages):", self.hotword_window_messages_entry)
+
+        self.hotword_window_seconds_entry = QtWidgets.QLineEdit()
+        self.hotword_window_seconds_entry.setPlaceholderText("0 = no time limit")
+        self.hotword_window_seconds_entry.setValidator(QtGui.QIntValidator(0, 86400, self))
+        layout.addRow("Hot-word Window (seconds):", self.hotword_window_seconds_entry)
+
+        self.overlay_port_entry = QtWidgets.QLineEdit()
+        self.overlay_port_entry.setPlaceholderText("8765")
+        self.overlay_port_entry.setValidator(QtGui.QIntValidator(1, 65535, self))
+        layout.addRow("Overlay Port:", self.overlay_port_entry)
+
+        self.metrics_port_entry = QtWidgets.QLineEdit()
+        self.metrics_port_entry.setPlaceholderText("9464")
+        self.metrics_port_entry.setValidator(QtGui.QIntValidator(1, 65535, self))
+        layout.addRow("Metrics Port:", self.metrics_port_entry)
+
+        self.points_chunk_size_entry = QtWidgets.QLineEdit()
+        self.points_chunk_size_entry.setPlaceholderText("5000")
+        self.points_chunk_size_entry.setValidator(QtGui.QIntValidator(1, 1000000, self))
+        layout.addRow("Points Upload Chunk Size:", self.points_chunk_size_entry)
+
+        self.points_upload_workers_entry = QtWidgets.QLineEdit()
+        self.points_upload_workers_entry.setPlaceholderText("4")
+        self.points_upload_workers_entry.setValidator(QtGui.QIntValidator(1, 64, self))
+        layout.addRow("Points Upload Workers:", self.points_upload_workers_entry)
+
+        self.points_gzip_checkbox = QtWidgets.QCheckBox("Gzip point uploads (backend must accept Content-Encoding: gzip)")
+        layout.addRow("Points Compression:", self.points_gzip_checkbox)
+
         return chat_settings
 
     def browse_offer_file(self):
@@ -129,31 +196,62 @@ class SettingsTab(QtWidgets.QWidget):
     def save_settings(self):
         self.parent.settings["api_url"] = self.api_url_entry.text().strip()
         self.parent.settings["streamer_id"] = self.api_streamer_id_entry.text().strip()
+        self.parent.settings["log_level"] = self.log_level_selector.currentText()
         self.parent.settings["offer_file"] = self.offer_entry.text().strip()
         self.parent.settings["deposit_file"] = self.deposit_entry.text().strip()
         self.parent.settings["casino_play_image_file"] = self.casino_play_image_entry.text().strip()
         self.parent.settings["casino_title_file"] = self.casino_title_entry.text().strip()
         self.parent.settings["youtube_api"] = self.youtube_api_entry.text().strip()
         self.parent.settings["yt_channel"] = self.yt_channel_entry.text().strip()
+        self.parent.settings["youtube_api_base"] = self.youtube_api_base_entry.text().strip()
+        self.parent.settings["youtube_daily_quota"] = self.youtube_daily_quota_entry.text().strip()
         self.parent.settings["kick_channel"] = self.kick_channel_entry.text().strip()
+        self.parent.settings["kick_pusher_url"] = self.kick_pusher_url_entry.text().strip()
+        self.parent.settings["kick_api_base"] = self.kick_api_base_entry.text().strip()
         self.parent.settings["chat_points"] = self.points_entry.text().strip()
         self.parent.settings["chat_interval"] = self.interval_entry.text().strip()
         self.parent.settings["ignored_users"] = self.ignored_users_entry.text().strip()
+        self.parent.settings["chat_backend"] = self.chat_backend_selector.currentText()
+        self.parent.settings["youtube_web_base"] = self.youtube_web_base_entry.text().strip()
+        self.parent.settings["dedup_bloom"] = "true" if self.dedup_bloom_checkbox.isChecked() else ""
+        self.parent.settings["points_gzip"] = "true" if self.points_gzip_checkbox.isChecked() else ""
+        self.parent.settings["hotword_window_messages"] = self.hotword_window_messages_entry.text().strip()
+        self.parent.settings["hotword_window_seconds"] = self.hotword_window_seconds_entry.text().strip()
+        self.parent.settings["overlay_port"] = self.overlay_port_entry.text().strip()
+        self.parent.settings["metrics_port"] = self.metrics_port_entry.text().strip()
+        self.parent.settings["points_chunk_size"] = self.points_chunk_size_entry.text().strip()
+        self.parent.settings["points_upload_workers"] = self.points_upload_workers_entry.text().strip()
 
         self.parent.settings_manager.save(self.parent.settings)
+        self.parent.settings_changed.emit(self.parent.settings)
 
         self.parent.log_status("Settings saved successfully.")
 
     def load_settings(self):
         self.api_url_entry.setText(self.parent.settings.get('api_url', ''))
         self.api_streamer_id_entry.setText(self.parent.settings.get('streamer_id', ''))
+        self.log_level_selector.setCurrentText(self.parent.settings.get('log_level', '') or DEFAULT_LEVEL)
         self.offer_entry.setText(self.parent.settings.get('offer_file', ''))
         self.deposit_entry.setText(self.parent.settings.get('deposit_file', ''))
         self.casino_play_image_entry.setText(self.parent.settings.get('casino_play_image_file', ''))
         self.casino_title_entry.setText(self.parent.settings.get('casino_title_file', ''))
         self.youtube_api_entry.setText(self.parent.settings.get('youtube_api', ''))
         self.yt_channel_entry.setText(self.parent.settings.get('yt_channel', ''))
+        self.youtube_api_base_entry.setText(self.parent.settings.get('youtube_api_base', ''))
+        self.youtube_daily_quota_entry.setText(self.parent.settings.get('youtube_daily_quota', ''))
         self.kick_channel_entry.setText(self.parent.settings.get('kick_channel', ''))
+        self.kick_pusher_url_entry.setText(self.parent.settings.get('kick_pusher_url', ''))
+        self.kick_api_base_entry.setText(self.parent.settings.get('kick_api_base', ''))
         self.points_entry.setText(self.parent.settings.get('chat_points', ''))
         self.interval_entry.setText(self.parent.settings.get('chat_interval', ''))
-        self.ignored_users_entry.setText(self.parent.settings.get('ignored_users', ''))
\ No newline at end of file
+        self.ignored_users_entry.setText(self.parent.settings.get('ignored_users', ''))
+        self.chat_backend_selector.setCurrentText(self.parent.settings.get('chat_backend', '') or "browser")
+        self.youtube_web_base_entry.setText(self.parent.settings.get('youtube_web_base', ''))
+        self.dedup_bloom_checkbox.setChecked(self.parent.settings.get('dedup_bloom', '') == "true")
+        self.points_gzip_checkbox.setChecked(self.parent.settings.get('points_gzip', '') == "true")
+        self.hotword_window_messages_entry.setText(self.parent.settings.get('hotword_window_messages', ''))
+        self.hotword_window_seconds_entry.setText(self.parent.settings.get('hotword_window_seconds', ''))
+        self.overlay_port_entry.setText(self.parent.settings.get('overlay_port', ''))
+        self.metrics_port_entry.setText(self.parent.settings.get('metrics_port', ''))
+        self.points_chunk_size_entry.setText(self.parent.settings.get('points_chunk_size', ''))
+        self.points_upload_workers_entry.setText(self.parent.settings.get('points_upload_workers', ''))
\ No newline at end of file
@@ -0,0 +1,112 @@
+import heapq
+import threading
+import time
+
+
+class UserActivityIndex:
+    """
+    In-memory index of user activity used to answer active/inactive queries
+    without touching SQLite.
+
+    Each active user has one entry in a min-heap keyed by the time they would
+    expire. Activity after the entry was pushed is picked up lazily: when a
+    stale entry reaches the top it is re-pushed with the user's real expiry
+    instead of deactivating them.
+
+    Users touched, expired or removed since the last ``drain_changes`` call are
+    collected so views can update only those rows. ``generation`` is bumped on
+    ``clear`` so views know to rebuild from scratch.
+
+    Mutations happen on the GUI thread and hold ``lock`` so other threads can
+    take consistent snapshots with ``snapshot_active``.
+    """
+
+    def __init__(self, inactive_timeout):
+        self.inactive_timeout = inactive_timeout
+        self.users = {}  # user_id -> [last_activity, message_count, is_member, channel_id]
+        self.active = set()
+        self.expiry_heap = []
+        self.changed = set()
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def clear(self):
+        with self.lock:
+            self.users.clear()
+            self.active.clear()
+            self.expiry_heap.clear()
+            self.changed.clear()
+            self.generation += 1
+
+    def drain_changes(self):
+        changed = self.changed
+        self.changed = set()
+        return changed
+
+    def touch(self, user_id, last_activity, message_count=1, is_member=False, channel_id=None):
+        with self.lock:
+            user = self.users.get(user_id)
+            if user is None:
+                self.users[user_id] = [last_activity, message_count, is_member, channel_id]
+            else:
+                user[0] = max(user[0], last_activity)
+                user[1] += message_count
+                user[2] = is_member
+                user[3] = channel_id or user[3]
+            self.changed.add(user_id)
+            if user_id not in self.active:
+                self.active.add(user_id)
+                heapq.heappush(self.expiry_heap, (self.users[user_id][0] + self.inactive_timeout, user_id))
+
+    def remove(self, user_id):
+        with self.lock:
+            self.users.pop(user_id, None)
+            self.active.discard(user_id)
+            self.changed.add(user_id)
+
+    def snapshot_active(self, now=None):
+        """Return the ids of users active at ``now``, consistent even while the GUI thread mutates the index."""
+        if now is None:
+            now = time.time()
+        cutoff = now - self.inactive_timeout
+        with self.lock:
+            return [user_id for user_id in self.active if self.users[user_id][0] > cutoff]
+
+    def expire(self, now=None):
+        """Deactivate users whose last activity is older than the timeout and return them."""
+        if now is None:
+            now = time.time()
+        expired = []
+        heap = self.expiry_heap
+        with self.lock:
+            while heap and heap[0][0] <= now:
+                _, user_id = heapq.heappop(heap)
+                if user_id not in self.active:
+                    continue
+                expires_at = self.users[user_id][0] + self.inactive_timeout
+                if expires_at <= now:
+                    self.active.discard(user_id)
+                    self.changed.add(user_id)
+                    expired.append(user_id)
+                else:
+                    heapq.heappush(heap, (expires_at, user_id))
+        return expired
+
+    def active_count(self):
+        return len(self.active)
+
+    def total_count(self):
+        return len(self.users)
+
+    def user_channels(self):
+        return [(user_id, user[3]) for user_id, user in self.users.items()]
+
+    def user_row(self, user_id):
+        last_activity, message_count, is_member, _ = self.users[user_id]
+        return user_id, last_activity, message_count, 1 if is_member else 0
+
+    def active_users(self):
+        return [self.user_row(user_id) for user_id in self.active]
+
+    def inactive_users(self):
+        return [self.user_row(user_id) for user_id in self.users if user_id not in self.active]
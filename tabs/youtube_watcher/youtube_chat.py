@@ -1,95 +1,231 @@
-import requests
-from utils.environment import is_dev
+import re
+import time
+import unicodedata
+from collections import deque
 
-# Replace with your actual API key if needed.
 STOP_WORDS = {"și", "la", "si", "de", "in", "în", "pe", "el", "e", "ai", "eu", "cu", "ca", "rotiri", "gratuite", "fara", "depunere", "ala"}
 
-def get_live_video_id(yt_channel, api_key):
-    if is_dev():
-        return 'NIYOTPN-KKs'
-    else:
-        """
-        Check if the given channel is live and return the live video ID.
-        If no live stream is found, returns None.
-        """
-        url = "https://www.googleapis.com/youtube/v3/search"
-        params = {
-            "part": "snippet",
-            "channelId": yt_channel,
-            "eventType": "live",
-            "type": "video",
-            "key": api_key
-        }
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        items = data.get("items", [])
-        if items:
-            return items[0]["id"]["videoId"]
-        return None
-
-
-def analyze_hot_message(chat_messages):
+
+class HotMessageWindow:
     """
-    Analyze chat messages and return the single most frequently repeated message
-    ("hot message") and the percentage of messages that match it.
+    Sliding window over recent chat messages that keeps per-message counts
+    current as messages enter and leave, so the hottest messages can be read
+    at any time without rescanning the window.
+
+    The window holds at most ``max_messages`` messages and, when ``max_age`` is
+    set, only messages younger than ``max_age`` seconds. Keys are grouped in
+    buckets by count so the top-k walk starts from the current maximum, and the
+    original casing is cached per key while it is in the window.
     """
-    # Use the last 200 messages if available, else the last 100.
-    messages = chat_messages[-200:] if len(chat_messages) >= 200 else chat_messages[-100:]
-    message_occurrence = {}
-
-    # Count frequency based on a normalized (lowercase and stripped) version of the message.
-    for msg in messages:
-        normalized = msg.strip().lower()
-        message_occurrence[normalized] = message_occurrence.get(normalized, 0) + 1
-
-    # Consider only messages that appear at least 2 times.
-    candidates = {m: count for m, count in message_occurrence.items() if count >= 2}
-    if not candidates:
-        return None, 0.0
-
-    # Find the most frequent message.
-    hot_message_normalized = max(candidates, key=lambda m: candidates[m])
-    count = candidates[hot_message_normalized]
-    percent = (count / len(messages)) * 100
-
-    # Retrieve the original version (with original case) from messages.
-    for msg in messages:
-        if msg.strip().lower() == hot_message_normalized:
-            return msg, percent
-
-    return None, 0.0
 
-
-def analyze_top_messages(chat_messages, top_n=3):
+    def __init__(self, max_messages=100, max_age=0):
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self.entries = deque()  # (timestamp, key)
+        self.counts = {}
+        self.buckets = {}  # count -> {key: None}, an insertion-ordered set
+        self.max_count = 0
+        self.originals = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.originals.clear()
+        self.max_count = 0
+
+    def add(self, message, timestamp=None):
+        text = message.strip()
+        if not text:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        key = text.lower()
+        count = self.counts.get(key, 0)
+        if count == 0:
+            self.originals[key] = text
+        self.entries.append((timestamp, key))
+        self._move(key, count, count + 1)
+        self.evict(timestamp)
+
+    def evict(self, now=None):
+        while len(self.entries) > self.max_messages:
+            self._remove_oldest()
+        if self.max_age:
+            if now is None:
+                now = time.time()
+            cutoff = now - self.max_age
+            while self.entries and self.entries[0][0] <= cutoff:
+                self._remove_oldest()
+
+    def _remove_oldest(self):
+        _, key = self.entries.popleft()
+        count = self.counts[key]
+        self._move(key, count, count - 1)
+        if count == 1:
+            del self.originals[key]
+
+    def _move(self, key, old_count, new_count):
+        if old_count:
+            bucket = self.buckets[old_count]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[old_count]
+        if new_count:
+            self.buckets.setdefault(new_count, {})[key] = None
+            self.counts[key] = new_count
+        else:
+            del self.counts[key]
+        if new_count > self.max_count:
+            self.max_count = new_count
+        elif old_count == self.max_count and old_count not in self.buckets:
+            self.max_count = new_count
+
+    def top(self, top_n=3, min_count=2):
+        """Return up to top_n (original message, percentage) tuples, most frequent first."""
+        result = []
+        total = len(self.entries)
+        count = self.max_count
+        while count >= min_count and len(result) < top_n:
+            for key in self.buckets.get(count, ()):
+                result.append((self.originals[key], (count / total) * 100))
+                if len(result) == top_n:
+                    break
+            count -= 1
+        return result
+
+
+EMOJI_SHORTCUT_PATTERN = re.compile(r":[\w-]+:")
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def fold_text(text):
+    """Lowercase and strip diacritics, so "Ș", "ş" and "s" all fold to "s"."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+FOLDED_STOP_WORDS = {fold_text(word) for word in STOP_WORDS}
+
+
+def tokenize(message):
+    """Split a chat message into folded words, dropping emoji, punctuation and stop words."""
+    words = WORD_PATTERN.findall(fold_text(EMOJI_SHORTCUT_PATTERN.sub(" ", message)))
+    return [word for word in words if len(word) > 1 and word not in FOLDED_STOP_WORDS]
+
+
+def message_terms(message):
+    """Return the distinct unigrams and bigrams of a message."""
+    words = tokenize(message)
+    terms = set(words)
+    terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return terms
+
+
+class CountMinSketch:
     """
-    Analyze chat messages and return the top_n most frequently repeated messages.
-    Each item in the returned list is a tuple: (message, percentage)
+    Fixed-size frequency sketch. Estimates never undercount, and decrements are
+    supported as long as only previously added items are removed.
     """
-    messages = chat_messages[-200:] if len(chat_messages) >= 200 else chat_messages[-100:]
-    message_occurrence = {}
 
-    for msg in messages:
-        normalized = msg.strip().lower()
-        message_occurrence[normalized] = message_occurrence.get(normalized, 0) + 1
+    def __init__(self, width=4096, depth=4):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, item):
+        h = hash(item)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
 
-    # Only consider messages that appear at least twice.
-    candidates = {m: count for m, count in message_occurrence.items() if count >= 2}
-    if not candidates:
-        return []
+    def add(self, item, delta=1):
+        """Add delta to item's counters and return its new estimate."""
+        estimate = None
+        for row, index in zip(self.rows, self._indexes(item)):
+            row[index] += delta
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        return estimate
 
-    # Sort messages by frequency in descending order.
-    sorted_candidates = sorted(candidates.items(), key=lambda item: item[1], reverse=True)
-    top_messages = []
+    def estimate(self, item):
+        return min(row[index] for row, index in zip(self.rows, self._indexes(item)))
 
-    for normalized_msg, count in sorted_candidates[:top_n]:
-        percent = (count / len(messages)) * 100
-        # Retrieve the original version from the messages list.
-        for msg in messages:
-            if msg.strip().lower() == normalized_msg:
-                top_messages.append((msg, percent))
-                break
+    def clear(self):
+        for row in self.rows:
+            row[:] = [0] * self.width
 
-    return top_messages
 
+class HotTokenCounter:
+    """
+    Sliding window of chat messages counted by word and word pair rather than by
+    whole message, so "SPIN", "spin!!" and "spin pls" trend together.
+
+    Term counts (messages containing the term) live in a count-min sketch and
+    only the ``capacity`` heaviest terms are tracked by name, so memory stays
+    bounded whatever the vocabulary. Windowing matches HotMessageWindow.
+    """
 
+    def __init__(self, max_messages=100, max_age=0, width=4096, depth=4, capacity=64):
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self.capacity = capacity
+        self.entries = deque()  # (timestamp, terms)
+        self.sketch = CountMinSketch(width, depth)
+        self.heavy_hitters = {}  # term -> estimated count
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.sketch.clear()
+        self.heavy_hitters.clear()
+
+    def add(self, message, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        terms = message_terms(message)
+        self.entries.append((timestamp, terms))
+        for term in terms:
+            self._offer(term, self.sketch.add(term))
+        self.evict(timestamp)
+
+    def _offer(self, term, estimate):
+        heavy_hitters = self.heavy_hitters
+        if term in heavy_hitters or len(heavy_hitters) < self.capacity:
+            heavy_hitters[term] = estimate
+            return
+        weakest = min(heavy_hitters, key=heavy_hitters.get)
+        if estimate > heavy_hitters[weakest]:
+            del heavy_hitters[weakest]
+            heavy_hitters[term] = estimate
+
+    def evict(self, now=None):
+        while len(self.entries) > self.max_messages:
+            self._remove_oldest()
+        if self.max_age:
+            if now is None:
+                now = time.time()
+            cutoff = now - self.max_age
+            while self.entries and self.entries[0][0] <= cutoff:
+                self._remove_oldest()
+
+    def _remove_oldest(self):
+        _, terms = self.entries.popleft()
+        for term in terms:
+            estimate = self.sketch.add(term, -1)
+            if term in self.heavy_hitters:
+                if estimate > 0:
+                    self.heavy_hitters[term] = estimate
+                else:
+                    del self.heavy_hitters[term]
+
+    def top(self, top_n=3, min_count=2):
+        """Return up to top_n (term, percentage of messages containing it) tuples."""
+        total = len(self.entries)
+        ranked = sorted(self.heavy_hitters.items(), key=lambda item: item[1], reverse=True)
+        return [(term, (count / total) * 100) for term, count in ranked[:top_n] if count >= min_count]
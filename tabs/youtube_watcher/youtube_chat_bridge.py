@@ -0,0 +1,208 @@
+import json
+import logging
+import time
+
+from PyQt5 import QtCore
+from PyQt5.QtWebChannel import QWebChannel
+from PyQt5.QtWebEngineWidgets import QWebEngineScript
+
+from utils.metrics import METRICS
+
+logger = logging.getLogger('YouTubeChatBridge')
+
+# Injected into the live chat page. Watches the chat item list and pushes only
+# newly added message renderers to Python through the "chatBridge" object as a
+# JSON array of message records, each stamped with the time it was observed.
+CHAT_OBSERVER_JS = """
+(function () {
+    if (window.__chatBridgeInstalled) {
+        return;
+    }
+    window.__chatBridgeInstalled = true;
+
+    var MESSAGE_TAG = "YT-LIVE-CHAT-TEXT-MESSAGE-RENDERER";
+    var bridge = null;
+    var pending = [];
+    var flushScheduled = false;
+
+    function runsToText(runs) {
+        var parts = [];
+        for (var i = 0; i < runs.length; i++) {
+            var run = runs[i];
+            if (run.text !== undefined) {
+                parts.push(run.text);
+            } else if (run.emoji) {
+                var shortcuts = run.emoji.shortcuts || [];
+                parts.push(run.emoji.isCustomEmoji && shortcuts.length ? shortcuts[0] : run.emoji.emojiId);
+            }
+        }
+        return parts.join("");
+    }
+
+    function nodesToText(elem) {
+        var parts = [];
+        var children = elem.childNodes;
+        for (var i = 0; i < children.length; i++) {
+            var child = children[i];
+            if (child.nodeType === Node.TEXT_NODE) {
+                parts.push(child.nodeValue);
+            } else if (child.nodeName === "IMG") {
+                parts.push(child.alt || "");
+            } else {
+                parts.push(child.textContent);
+            }
+        }
+        return parts.join("");
+    }
+
+    function badgesFromData(data) {
+        var badges = [];
+        var authorBadges = data.authorBadges || [];
+        for (var i = 0; i < authorBadges.length; i++) {
+            var badge = authorBadges[i].liveChatAuthorBadgeRenderer;
+            if (badge) {
+                badges.push(badge.icon ? badge.icon.iconType.toLowerCase() : "member");
+            }
+        }
+        return badges;
+    }
+
+    function serialize(node) {
+        // Prefer the renderer's data model; fall back to the stamped DOM.
+        var data = node.data;
+        if (data && data.id) {
+            return {
+                message_id: data.id,
+                channel_id: data.authorExternalChannelId || null,
+                author: data.authorName ? data.authorName.simpleText : "Unknown",
+                message: data.message ? runsToText(data.message.runs || []) : "",
+                badges: badgesFromData(data),
+                timestamp_usec: data.timestampUsec || null
+            };
+        }
+        var userElem = node.querySelector("#author-name");
+        var messageElem = node.querySelector("#message");
+        var badgeElems = node.querySelectorAll("yt-live-chat-author-badge-renderer");
+        var badges = [];
+        for (var i = 0; i < badgeElems.length; i++) {
+            badges.push(badgeElems[i].getAttribute("type") || "member");
+        }
+        return {
+            message_id: node.id,
+            channel_id: null,
+            author: userElem ? userElem.textContent.trim() : "Unknown",
+            message: messageElem ? nodesToText(messageElem) : "",
+            badges: badges,
+            timestamp_usec: null
+        };
+    }
+
+    function flush() {
+        flushScheduled = false;
+        if (!bridge || pending.length === 0) {
+            return;
+        }
+        // Serialize on flush rather than on insert so Polymer has stamped the content.
+        var batch = pending.map(function (entry) {
+            var record = serialize(entry.node);
+            record.observed_ms = entry.observed_ms;
+            return record;
+        });
+        pending = [];
+        bridge.pushMessages(JSON.stringify(batch));
+    }
+
+    function enqueue(node) {
+        pending.push({node: node, observed_ms: Date.now()});
+        if (!flushScheduled) {
+            flushScheduled = true;
+            setTimeout(flush, 50);
+        }
+    }
+
+    function attach() {
+        var items = document.querySelector("yt-live-chat-item-list-renderer #items");
+        if (!items) {
+            setTimeout(attach, 250);
+            return;
+        }
+        var existing = items.getElementsByTagName(MESSAGE_TAG);
+        for (var i = 0; i < existing.length; i++) {
+            enqueue(existing[i]);
+        }
+        new MutationObserver(function (mutations) {
+            for (var m = 0; m < mutations.length; m++) {
+                var added = mutations[m].addedNodes;
+                for (var n = 0; n < added.length; n++) {
+                    if (added[n].nodeName === MESSAGE_TAG) {
+                        enqueue(added[n]);
+                    }
+                }
+            }
+        }).observe(items, {childList: true});
+    }
+
+    new QWebChannel(qt.webChannelTransport, function (channel) {
+        bridge = channel.objects.chatBridge;
+        attach();
+    });
+})();
+"""
+
+
+class ChatBridge(QtCore.QObject):
+    """
+    Receives chat message batches pushed from the live chat page and re-emits
+    them as a list of message record dicts with the keys message_id, channel_id,
+    author, message, badges and timestamp_usec. The delay from the oldest
+    record being observed on the page to its arrival here is recorded as the
+    js_extraction stage.
+    """
+
+    messages_received = QtCore.pyqtSignal(list)
+
+    @QtCore.pyqtSlot(str)
+    def pushMessages(self, payload):
+        received_ms = time.time() * 1000
+        started = time.perf_counter()
+        try:
+            records = json.loads(payload)
+        except ValueError as e:
+            logger.error(f"Malformed chat payload: {e}")
+            return
+        METRICS.observe("payload_parse", time.perf_counter() - started, len(records))
+        if records:
+            observed_ms = min(record.get("observed_ms") or received_ms for record in records)
+            METRICS.observe("js_extraction", max(0.0, received_ms - observed_ms) / 1000, len(records))
+            self.messages_received.emit(records)
+
+
+def load_qwebchannel_js():
+    qwebchannel_js = QtCore.QFile(":/qtwebchannel/qwebchannel.js")
+    if not qwebchannel_js.open(QtCore.QIODevice.ReadOnly):
+        raise RuntimeError("Unable to load qwebchannel.js from Qt resources")
+    try:
+        return bytes(qwebchannel_js.readAll()).decode("utf-8")
+    finally:
+        qwebchannel_js.close()
+
+
+def install_chat_bridge(view, bridge):
+    """
+    Register the bridge on the view's page and inject the observer script so it
+    runs on every load of the chat page. Returns the QWebChannel, which the caller
+    must keep a reference to.
+    """
+    page = view.page()
+    channel = QWebChannel(page)
+    channel.registerObject("chatBridge", bridge)
+    page.setWebChannel(channel)
+
+    script = QWebEngineScript()
+    script.setName("chatBridge")
+    script.setSourceCode(load_qwebchannel_js() + CHAT_OBSERVER_JS)
+    script.setInjectionPoint(QWebEngineScript.DocumentReady)
+    script.setWorldId(QWebEngineScript.MainWorld)
+    script.setRunsOnSubFrames(False)
+    page.scripts().insert(script)
+    return channel
@@ -0,0 +1,189 @@
+import json
+import logging
+import re
+import threading
+import time
+
+import requests
+from PyQt5 import QtCore
+
+from utils.metrics import METRICS
+
+logger = logging.getLogger('YouTubeChatPoller')
+
+YOUTUBE_WEB_BASE = "https://www.youtube.com"
+REQUEST_TIMEOUT = (3.05, 15)
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36")
+MIN_POLL_SECONDS = 0.5
+MAX_POLL_SECONDS = 30.0
+MAX_FAILURES = 5
+
+API_KEY_RE = re.compile(r'"INNERTUBE_API_KEY"\s*:\s*"([^"]+)"')
+CLIENT_VERSION_RE = re.compile(r'"INNERTUBE_CLIENT_VERSION"\s*:\s*"([^"]+)"')
+INITIAL_DATA_RE = re.compile(r'(?:window\s*\[\s*"ytInitialData"\s*\]|ytInitialData)\s*=\s*(\{.+?\})\s*;\s*</script>',
+                             re.DOTALL)
+
+
+class ChatEnded(Exception):
+    pass
+
+
+def runs_to_text(runs):
+    parts = []
+    for run in runs:
+        if "text" in run:
+            parts.append(run["text"])
+        elif "emoji" in run:
+            emoji = run["emoji"]
+            shortcuts = emoji.get("shortcuts") or []
+            parts.append(shortcuts[0] if emoji.get("isCustomEmoji") and shortcuts else emoji.get("emojiId", ""))
+    return "".join(parts)
+
+
+def badges_from_renderer(renderer):
+    badges = []
+    for badge in renderer.get("authorBadges", []):
+        badge = badge.get("liveChatAuthorBadgeRenderer")
+        if badge:
+            icon = badge.get("icon")
+            badges.append(icon["iconType"].lower() if icon else "member")
+    return badges
+
+
+def parse_chat_actions(actions):
+    """Turn live chat actions into the same records the browser bridge pushes."""
+    records = []
+    for action in actions:
+        item = action.get("addChatItemAction", {}).get("item", {})
+        renderer = item.get("liveChatTextMessageRenderer")
+        if not renderer or not renderer.get("id"):
+            continue
+        records.append({
+            "message_id": renderer["id"],
+            "channel_id": renderer.get("authorExternalChannelId"),
+            "author": renderer.get("authorName", {}).get("simpleText", "Unknown"),
+            "message": runs_to_text(renderer.get("message", {}).get("runs", [])),
+            "badges": badges_from_renderer(renderer),
+            "timestamp_usec": renderer.get("timestampUsec"),
+        })
+    return records
+
+
+def next_continuation(live_chat_continuation):
+    """Return (token, seconds until the server wants the next poll), or (None, None) when chat has ended."""
+    for continuation in live_chat_continuation.get("continuations", []):
+        data = (continuation.get("invalidationContinuationData")
+                or continuation.get("timedContinuationData")
+                or continuation.get("reloadContinuationData"))
+        if data and data.get("continuation"):
+            timeout_ms = data.get("timeoutMs", 5000)
+            return data["continuation"], min(MAX_POLL_SECONDS, max(MIN_POLL_SECONDS, timeout_ms / 1000))
+    return None, None
+
+
+class LiveChatPoller(QtCore.QObject):
+    """
+    Headless chat ingestion: reads the live chat page once to get the API key,
+    client version and first continuation token, then polls the
+    ``get_live_chat`` JSON endpoint, waiting as long as each response asks.
+    Records are emitted through ``messages_received`` in the same format as
+    ChatBridge, so the rest of the pipeline does not care which one is used.
+    """
+
+    messages_received = QtCore.pyqtSignal(list)
+    poll_failed = QtCore.pyqtSignal(str)
+    chat_ended = QtCore.pyqtSignal(str)
+
+    def __init__(self, web_base=YOUTUBE_WEB_BASE, parent=None):
+        super().__init__(parent)
+        self.web_base = (web_base or YOUTUBE_WEB_BASE).rstrip("/")
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        self.video_id = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self, video_id):
+        """Start (or switch) polling the chat of video_id."""
+        self.stop()
+        self.video_id = video_id
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(video_id, self.stop_event),
+                                       name="YouTubeChatPoller", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        # Not joined: a request in flight would block the GUI thread until it times out.
+        # The old thread checks its own stop event before emitting anything.
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread = None
+
+    def bootstrap(self, video_id):
+        response = self.session.get(f"{self.web_base}/live_chat", params={"v": video_id, "is_popout": 1},
+                                    timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        html = response.text
+        api_key = API_KEY_RE.search(html)
+        client_version = CLIENT_VERSION_RE.search(html)
+        initial_data = INITIAL_DATA_RE.search(html)
+        if not (api_key and client_version and initial_data):
+            raise ValueError("Live chat page did not contain the expected configuration")
+        data = json.loads(initial_data.group(1))
+        live_chat = data.get("contents", {}).get("liveChatRenderer", {})
+        token, _ = next_continuation(live_chat)
+        if token is None:
+            raise ChatEnded(f"Live chat for {video_id} is not available")
+        records = parse_chat_actions(live_chat.get("actions", []))
+        return api_key.group(1), client_version.group(1), token, records
+
+    def fetch(self, api_key, client_version, token):
+        body = {
+            "context": {"client": {"clientName": "WEB", "clientVersion": client_version}},
+            "continuation": token,
+        }
+        response = self.session.post(f"{self.web_base}/youtubei/v1/live_chat/get_live_chat",
+                                     params={"key": api_key, "prettyPrint": "false"}, json=body,
+                                     timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        started = time.perf_counter()
+        live_chat = response.json().get("continuationContents", {}).get("liveChatContinuation")
+        if live_chat is None:
+            raise ChatEnded("Live chat ended")
+        next_token, delay = next_continuation(live_chat)
+        if next_token is None:
+            raise ChatEnded("Live chat ended")
+        records = parse_chat_actions(live_chat.get("actions", []))
+        METRICS.observe("payload_parse", time.perf_counter() - started, len(records))
+        return next_token, delay, records
+
+    def run(self, video_id, stop_event):
+        logger.info(f"Polling live chat for {video_id}")
+        failures = 0
+        token = None
+        while not stop_event.is_set():
+            try:
+                if token is None:
+                    api_key, client_version, token, records = self.bootstrap(video_id)
+                    delay = MIN_POLL_SECONDS
+                else:
+                    token, delay, records = self.fetch(api_key, client_version, token)
+                failures = 0
+                if records and not stop_event.is_set():
+                    self.messages_received.emit(records)
+            except ChatEnded as e:
+                logger.info(str(e))
+                if not stop_event.is_set():
+                    self.chat_ended.emit(video_id)
+                return
+            except (requests.RequestException, ValueError) as e:
+                failures += 1
+                logger.warning(f"Live chat poll failed ({failures}): {e}")
+                self.poll_failed.emit(str(e))
+                if failures >= MAX_FAILURES:
+                    # The continuation may have expired; start over from the chat page.
+                    token = None
+                    failures = 0
+                delay = min(MAX_POLL_SECONDS, 2 ** failures)
+            stop_event.wait(delay)
@@ -0,0 +1,174 @@
+"""
+Local stand-in for YouTube's live chat page and ``get_live_chat`` endpoint,
+for exercising the headless chat backend without a real stream. Messages come
+from a JSON-lines file (one ``{"author": ..., "message": ...}`` object per line,
+optionally with ``channel_id`` and ``badges``) or are generated. Set the
+``youtube_web_base`` setting to the printed URL, e.g.
+
+    python -m tabs.youtube_watcher.youtube_chat_replay --port 8767 --file chat.jsonl
+"""
+import argparse
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+from utils.local_http_server import LocalHTTPServer, LocalRequestHandler
+
+logger = logging.getLogger('YouTubeChatReplay')
+
+DEFAULT_REPLAY_PORT = 8767
+REPLAY_API_KEY = "replay-key"
+REPLAY_CLIENT_VERSION = "2.20240101.00.00"
+
+CHAT_PAGE = """<!DOCTYPE html>
+<html><head><script>ytcfg.set({"INNERTUBE_API_KEY": "%(api_key)s", "INNERTUBE_CLIENT_VERSION": "%(client_version)s"});</script>
+<script>window["ytInitialData"] = %(initial_data)s;</script>
+</head><body></body></html>
+"""
+
+
+def generated_messages():
+    words = ["hello", "gg", "spin", "bonus", "lets go", "nice win", "free spins", "hi chat"]
+    while True:
+        yield {"author": f"viewer{random.randint(1, 200)}", "message": random.choice(words)}
+
+
+def load_messages(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ChatReplay:
+    """Feeds a fixed number of messages per poll and ends the chat when a file replay runs out."""
+
+    def __init__(self, messages=None, per_poll=5, poll_ms=1000):
+        self.lock = threading.Lock()
+        self.source = iter(messages) if messages is not None else generated_messages()
+        self.per_poll = per_poll
+        self.poll_ms = poll_ms
+        self.sequence = 0
+        self.ended = False
+        self.polls = 0
+
+    def next_actions(self):
+        with self.lock:
+            self.polls += 1
+            actions = []
+            for message in itertools.islice(self.source, self.per_poll):
+                self.sequence += 1
+                actions.append(self.to_action(message, self.sequence))
+            if not actions and self.per_poll:
+                self.ended = True
+            return actions
+
+    @staticmethod
+    def to_action(message, sequence):
+        author = message.get("author", "Unknown")
+        renderer = {
+            "id": f"replay-{sequence}",
+            "authorName": {"simpleText": author},
+            "authorExternalChannelId": message.get("channel_id") or f"UCreplay{zlib.crc32(author.encode('utf-8')):016d}",
+            "message": {"runs": [{"text": message.get("message", "")}]},
+            "timestampUsec": str(int(time.time() * 1_000_000)),
+        }
+        badges = [{"liveChatAuthorBadgeRenderer": {"tooltip": badge}} for badge in message.get("badges", [])]
+        if badges:
+            renderer["authorBadges"] = badges
+        return {"addChatItemAction": {"item": {"liveChatTextMessageRenderer": renderer}}}
+
+    def continuation(self):
+        if self.ended:
+            return []
+        return [{"timedContinuationData": {"continuation": f"replay-{self.sequence}", "timeoutMs": self.poll_ms}}]
+
+
+class ChatReplayHandler(LocalRequestHandler):
+    logger = logger
+    server_version = "YouTubeChatReplay/1.0"
+
+    def do_GET(self):
+        if urlparse(self.path).path != "/live_chat":
+            self.send_error(404)
+            return
+        replay = self.server.owner.replay
+        initial_data = {"contents": {"liveChatRenderer": {
+            "actions": replay.next_actions(),
+            "continuations": replay.continuation(),
+        }}}
+        page = CHAT_PAGE % {
+            "api_key": REPLAY_API_KEY,
+            "client_version": REPLAY_CLIENT_VERSION,
+            "initial_data": json.dumps(initial_data),
+        }
+        self.send_body(page.encode("utf-8"), "text/html; charset=utf-8")
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/youtubei/v1/live_chat/get_live_chat":
+            self.send_error(404)
+            return
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        replay = self.server.owner.replay
+        actions = replay.next_actions()
+        if replay.ended:
+            payload = {"continuationContents": {"liveChatContinuation": {"continuations": []}}}
+        else:
+            payload = {"continuationContents": {"liveChatContinuation": {
+                "actions": actions,
+                "continuations": replay.continuation(),
+            }}}
+        self.send_body(json.dumps(payload).encode("utf-8"), "application/json; charset=utf-8")
+
+    def send_body(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ChatReplayServer(LocalHTTPServer):
+    handler_class = ChatReplayHandler
+    thread_name = "YouTubeChatReplay"
+
+    def __init__(self, replay=None, port=DEFAULT_REPLAY_PORT, host="127.0.0.1"):
+        super().__init__(port, host)
+        self.replay = replay or ChatReplay()
+
+    @property
+    def web_base(self):
+        return self.base_url
+
+    def start(self):
+        super().start()
+        logger.info(f"Chat replay served at {self.web_base}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay live chat for the headless chat backend.")
+    parser.add_argument("--port", type=int, default=DEFAULT_REPLAY_PORT)
+    parser.add_argument("--file", help="JSON-lines file of messages; generated chat if omitted")
+    parser.add_argument("--per-poll", type=int, default=5)
+    parser.add_argument("--poll-ms", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    messages = load_messages(args.file) if args.file else None
+    server = ChatReplayServer(ChatReplay(messages, args.per_poll, args.poll_ms), args.port)
+    server.start()
+    print(f"Set youtube_web_base to {server.web_base}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import hashlib
+import math
+import time
+from collections import OrderedDict
+
+MIN_CAPACITY = 2000
+MAX_CAPACITY = 200000
+# Chat sources re-deliver ids for a few minutes at most (page reloads, reconnects, poll overlap).
+REPLAY_HORIZON_SECONDS = 300
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys, using double hashing on one SHA-1 digest."""
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, key):
+        digest = hashlib.sha1(key.encode("utf-8")).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:16], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        for position in self.positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(key))
+
+
+class RecentMessageIds:
+    """
+    Bounded set of recently seen message ids. Ids live in an LRU ring sized to
+    cover REPLAY_HORIZON_SECONDS of chat at the observed message rate, between
+    MIN_CAPACITY and MAX_CAPACITY, so memory stays flat however long the
+    stream runs.
+
+    With ``use_bloom`` ids evicted from the ring are also remembered in a pair
+    of rotating Bloom filters, catching much older replays at the cost of
+    occasionally (about 0.1%) dropping a new message as a false positive.
+    """
+
+    def __init__(self, use_bloom=False, horizon=REPLAY_HORIZON_SECONDS):
+        self.horizon = horizon
+        self.capacity = MIN_CAPACITY
+        self.ring = OrderedDict()
+        self.rate = 0.0
+        self.rate_started = time.monotonic()
+        self.rate_count = 0
+        self.use_bloom = use_bloom
+        self.blooms = [BloomFilter(MAX_CAPACITY), BloomFilter(MAX_CAPACITY)] if use_bloom else []
+
+    def __len__(self):
+        return len(self.ring)
+
+    def clear(self):
+        self.ring.clear()
+        if self.use_bloom:
+            self.blooms = [BloomFilter(MAX_CAPACITY), BloomFilter(MAX_CAPACITY)]
+
+    def update_rate(self, now):
+        elapsed = now - self.rate_started
+        if elapsed < 10:
+            return
+        # Exponentially weighted messages/second; the ring only ever grows so a lull cannot shrink it.
+        current = self.rate_count / elapsed
+        self.rate = current if self.rate == 0 else 0.7 * self.rate + 0.3 * current
+        self.rate_started, self.rate_count = now, 0
+        wanted = min(MAX_CAPACITY, max(MIN_CAPACITY, int(self.rate * self.horizon)))
+        self.capacity = max(self.capacity, wanted)
+
+    def check_and_add(self, message_id):
+        """Return True if message_id was seen recently, otherwise remember it and return False."""
+        if message_id in self.ring:
+            self.ring.move_to_end(message_id)
+            return True
+        if self.use_bloom and any(message_id in bloom for bloom in self.blooms):
+            return True
+        self.ring[message_id] = None
+        self.rate_count += 1
+        self.update_rate(time.monotonic())
+        while len(self.ring) > self.capacity:
+            evicted, _ = self.ring.popitem(last=False)
+            if self.use_bloom:
+                self.remember(evicted)
+        return False
+
+    def remember(self, message_id):
+        current = self.blooms[0]
+        if current.count >= current.capacity:
+            self.blooms = [BloomFilter(MAX_CAPACITY), current]
+            current = self.blooms[0]
+        current.add(message_id)
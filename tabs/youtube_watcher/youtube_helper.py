@@ -1,25 +1,227 @@
 import sqlite3
 import time
-import datetime
+import json
 import os
 import logging
+import queue
+import threading
 
+from tabs.youtube_watcher.youtube_activity import UserActivityIndex
 from utils.api_client import APIClient
-from utils.api_points import award_points
+from utils.metrics import METRICS
+from utils.user_filter import IgnoredUsersMatcher
 
-LOG_FILE = 'youtube_helper.log'
-if os.path.exists(LOG_FILE):
-    os.remove(LOG_FILE)
+logger = logging.getLogger('YouTubeHelper')
+DB_FILE = "youtube_chat.db"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='youtube_helper.log',
-    filemode='a'
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA temp_store=MEMORY",
 )
 
-logger = logging.getLogger('YouTubeHelper')
-DB_FILE = "youtube_chat.db"
+# Each entry moves the schema from version N-1 to N (stored in PRAGMA user_version).
+# Version 1 adopts databases created before versioning, whose tables already exist.
+SCHEMA_MIGRATIONS = (
+    (1, """
+        CREATE TABLE IF NOT EXISTS messages (
+            message_id TEXT PRIMARY KEY,
+            user_id TEXT,
+            message TEXT,
+            is_member INTEGER,
+            timestamp TEXT
+        );
+        CREATE TABLE IF NOT EXISTS users (
+            user_id TEXT PRIMARY KEY,
+            last_activity REAL,
+            is_active INTEGER,
+            message_count INTEGER,
+            is_member INTEGER,
+            channel_id TEXT
+        );
+    """),
+    (2, """
+        ALTER TABLE messages RENAME TO messages_v1;
+        CREATE TABLE messages (
+            seq INTEGER PRIMARY KEY,
+            message_id TEXT NOT NULL UNIQUE,
+            user_id TEXT,
+            message TEXT,
+            is_member INTEGER,
+            timestamp REAL
+        );
+        INSERT INTO messages (message_id, user_id, message, is_member, timestamp)
+            SELECT message_id, user_id, message, is_member, CAST(strftime('%s', timestamp, 'utc') AS REAL)
+            FROM messages_v1 ORDER BY timestamp;
+        DROP TABLE messages_v1;
+    """),
+    # Duplicates are filtered in memory before reaching the writer, so message_id no longer
+    # needs a UNIQUE index that every insert has to probe.
+    (3, """
+        ALTER TABLE messages RENAME TO messages_v2;
+        CREATE TABLE messages (
+            seq INTEGER PRIMARY KEY,
+            message_id TEXT NOT NULL,
+            user_id TEXT,
+            message TEXT,
+            is_member INTEGER,
+            timestamp REAL
+        );
+        INSERT INTO messages (seq, message_id, user_id, message, is_member, timestamp)
+            SELECT seq, message_id, user_id, message, is_member, timestamp FROM messages_v2;
+        DROP TABLE messages_v2;
+    """),
+    # Databases migrated by an earlier version 2 carry an activity index no query reads; the
+    # active set lives in memory and every users statement goes through the primary key.
+    (4, """
+        DROP INDEX IF EXISTS idx_users_activity;
+    """),
+)
+
+# Columns a migration adds to tables it adopts rather than creates: {version: ((table, column, type), ...)}.
+ADOPTED_COLUMNS = {
+    1: (("users", "channel_id", "TEXT"),),
+}
+
+INSERT_MESSAGE_SQL = """
+    INSERT INTO messages (message_id, user_id, message, is_member, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+UPSERT_USER_SQL = """
+    INSERT INTO users (user_id, last_activity, is_active, message_count, is_member, channel_id)
+    VALUES (?, ?, 1, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        last_activity = excluded.last_activity,
+        is_active = 1,
+        message_count = users.message_count + excluded.message_count,
+        is_member = excluded.is_member,
+        channel_id = COALESCE(excluded.channel_id, users.channel_id)
+"""
+
+
+def configure_connection(conn):
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def missing_columns_sql(conn, target_version):
+    """ALTER TABLE statements for adopted columns absent from tables that already exist."""
+    statements = []
+    for table, column, column_type in ADOPTED_COLUMNS.get(target_version, ()):
+        existing = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        if existing and column not in existing:
+            statements.append(f"ALTER TABLE {table} ADD COLUMN {column} {column_type};")
+    return " ".join(statements)
+
+
+def migrate_schema(conn):
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target_version, script in SCHEMA_MIGRATIONS:
+        if target_version <= version:
+            continue
+        logger.info(f"Migrating chat database schema to version {target_version}")
+        script += missing_columns_sql(conn, target_version)
+        conn.executescript(f"BEGIN; {script} PRAGMA user_version = {target_version}; COMMIT;")
+        version = target_version
+    return version
+
+
+class ChatWriter(threading.Thread):
+    """
+    Owns its own connection and drains queued message batches and user
+    deactivations, writing everything available at each wake-up in a single
+    transaction.
+    """
+
+    def __init__(self, db_file):
+        super().__init__(name="ChatWriter", daemon=True)
+        self.db_file = db_file
+        self.queue = queue.Queue()
+
+    def submit(self, messages):
+        self.queue.put(("messages", messages))
+
+    def submit_deactivations(self, user_ids, threshold):
+        self.queue.put(("deactivate", [(user_id, threshold) for user_id in user_ids]))
+
+    def submit_purge(self, user_ids):
+        self.queue.put(("purge", list(user_ids)))
+
+    def stop(self):
+        self.queue.put(None)
+        self.join()
+
+    def run(self):
+        conn = sqlite3.connect(self.db_file)
+        configure_connection(conn)
+        try:
+            stop = False
+            while not stop:
+                items = [self.queue.get()]
+                while True:
+                    try:
+                        items.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                messages = []
+                deactivations = []
+                purged = []
+                for item in items:
+                    if item is None:
+                        stop = True
+                    elif item[0] == "messages":
+                        messages.extend(item[1])
+                    elif item[0] == "deactivate":
+                        deactivations.extend(item[1])
+                    else:
+                        purged.extend(item[1])
+                if messages or deactivations or purged:
+                    self.write_batch(conn, messages, deactivations, purged)
+        finally:
+            conn.close()
+            logger.info("Chat writer stopped")
+
+    def write_batch(self, conn, messages, deactivations, purged):
+        # Any failure is logged and drops only this batch; the writer thread must keep draining.
+        try:
+            message_rows = []
+            users = {}
+            for msg in messages:
+                is_member_int = 1 if msg.get("is_member") else 0
+                channel_id = msg.get("channel_id")
+                message_rows.append((msg["message_id"], msg["user_id"], msg["message"], is_member_int,
+                                     msg["timestamp"]))
+                user = users.get(msg["user_id"])
+                if user is None:
+                    users[msg["user_id"]] = [msg["user_id"], msg["received_at"], 1, is_member_int, channel_id]
+                else:
+                    user[1] = msg["received_at"]
+                    user[2] += 1
+                    user[3] = is_member_int
+                    user[4] = channel_id or user[4]
+            started = time.perf_counter()
+            with conn:
+                conn.executemany(INSERT_MESSAGE_SQL, message_rows)
+                conn.executemany(UPSERT_USER_SQL, list(users.values()))
+                # The last_activity guard keeps a user active if a newer message landed in the same drain.
+                conn.executemany(
+                    "UPDATE users SET is_active = 0 WHERE user_id = ? AND last_activity < ?",
+                    deactivations
+                )
+                if purged:
+                    purged_json = json.dumps(purged)
+                    conn.execute("DELETE FROM messages WHERE user_id IN (SELECT value FROM json_each(?))",
+                                 (purged_json,))
+                    conn.execute("DELETE FROM users WHERE user_id IN (SELECT value FROM json_each(?))",
+                                 (purged_json,))
+            logger.debug("Wrote %d messages for %d users, %d deactivations",
+                         len(message_rows), len(users), len(deactivations))
+            METRICS.observe("db_write", time.perf_counter() - started, len(message_rows))
+        except Exception as e:
+            logger.error(f"Error writing message batch: {e}", exc_info=True)
 
 
 class YouTubeChatTracker:
@@ -28,19 +230,34 @@ class YouTubeChatTracker:
         self.api_client = APIClient(settings)
         self.inactive_timeout = int(self.settings.get('chat_interval', 1)) * 60
         self.db_file = db_file
-        self.last_points_award_time = 0
-        self.points_award_interval = self.inactive_timeout
         self.conn = None
         self.cursor = None
+        self.writer = None
+        self.activity = UserActivityIndex(self.inactive_timeout)
+        self.ignored_users = IgnoredUsersMatcher(self.settings.get('ignored_users', ''))
         self.reset_database()
-        self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                              user.strip()]
+
+    def set_ignored_users(self, spec):
+        """Recompile the ignored users matcher and drop newly ignored users from the session."""
+        self.ignored_users = IgnoredUsersMatcher(spec)
+        purged = [user_id for user_id, channel_id in self.activity.user_channels()
+                  if self.ignored_users.matches(user_id, channel_id)]
+        for user_id in purged:
+            self.activity.remove(user_id)
+        if purged:
+            logger.info(f"Removing {len(purged)} newly ignored users from the session")
+            self.writer.submit_purge(purged)
+        return purged
 
     def reset_database(self):
         logger.info(f"Creating fresh database: {self.db_file}")
         try:
+            if self.writer:
+                self.writer.stop()
+                self.writer = None
             if self.conn:
                 self.conn.close()
+            self.activity.clear()
             if os.path.exists(self.db_file):
                 os.remove(self.db_file)
                 logger.info(f"Removed existing database file: {self.db_file}")
@@ -58,147 +275,73 @@ class YouTubeChatTracker:
                 logger.info(f"Created database directory: {db_dir}")
             self.conn = sqlite3.connect(self.db_file)
             logger.debug("Database connection established")
-            self.conn.execute("PRAGMA journal_mode=WAL")
+            configure_connection(self.conn)
             self.cursor = self.conn.cursor()
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS messages (
-                    message_id TEXT PRIMARY KEY,
-                    user_id TEXT,
-                    message TEXT,
-                    is_member INTEGER,
-                    timestamp TEXT
-                )
-            ''')
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id TEXT PRIMARY KEY,
-                    last_activity REAL,
-                    is_active INTEGER,
-                    message_count INTEGER,
-                    is_member INTEGER
-                )
-            ''')
-            self.conn.commit()
-            logger.info("Database tables created successfully")
+            version = migrate_schema(self.conn)
+            logger.info(f"Database schema ready at version {version}")
+            self.writer = ChatWriter(self.db_file)
+            self.writer.start()
         except Exception as e:
             logger.error(f"Database initialization error: {e}", exc_info=True)
             raise
 
-    def add_message(self, message_id, user_id, message, is_member, timestamp=None):
-        self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                              user.strip()]
-        if user_id in self.ignored_users:
-            logger.debug(f"Ignoring message from {user_id} (in ignored users list)")
-            return True
-        logger.debug(f"Adding message from {user_id}: {message[:20]}...")
-        try:
-            if timestamp is None:
-                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            is_member_int = 1 if is_member == "Yes" else 0
-            self.cursor.execute(
-                "INSERT OR IGNORE INTO messages VALUES (?, ?, ?, ?, ?)",
-                (message_id, user_id, message, is_member_int, timestamp)
-            )
-            if self.cursor.rowcount > 0:
-                logger.debug(f"Message {message_id} inserted")
-                current_time = time.time()
-                self.cursor.execute(
-                    "SELECT message_count FROM users WHERE user_id = ?",
-                    (user_id,)
-                )
-                result = self.cursor.fetchone()
-                if result is None:
-                    logger.info(f"New user detected: {user_id}")
-                    self.cursor.execute(
-                        "INSERT INTO users VALUES (?, ?, ?, ?, ?)",
-                        (user_id, current_time, 1, 1, is_member_int)
-                    )
-                else:
-                    message_count = result[0] + 1
-                    self.cursor.execute(
-                        "UPDATE users SET last_activity = ?, is_active = 1, message_count = ?, is_member = ? WHERE user_id = ?",
-                        (current_time, message_count, is_member_int, user_id)
-                    )
-                    logger.debug(f"Updated user {user_id}, message count: {message_count}")
-            else:
-                logger.debug(f"Message {message_id} already exists, skipped")
-            self.conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"Error adding message: {e}", exc_info=True)
-            return False
+    def add_message(self, message_id, user_id, message, is_member, timestamp=None, channel_id=None):
+        self.add_messages([{
+            "message_id": message_id,
+            "user_id": user_id,
+            "message": message,
+            "is_member": is_member,
+            "timestamp": timestamp,
+            "channel_id": channel_id,
+        }])
+        return True
+
+    def add_messages(self, messages):
+        """
+        Queue a batch of message dicts (message_id, user_id, message, is_member,
+        timestamp, channel_id, and optionally the unprefixed author name used
+        for ignore matching) for the writer thread. Timestamps are epoch
+        seconds. Returns the accepted messages, stamped with received_at.
+        """
+        received_at = time.time()
+        batch = []
+        for msg in messages:
+            if self.ignored_users.matches(msg.get("author") or msg["user_id"], msg.get("channel_id")):
+                logger.debug("Ignoring message from %s (in ignored users list)", msg["user_id"])
+                continue
+            if msg.get("timestamp") is None:
+                msg["timestamp"] = received_at
+            msg["received_at"] = received_at
+            self.activity.touch(msg["user_id"], received_at, 1, bool(msg["is_member"]), msg.get("channel_id"))
+            batch.append(msg)
+        if batch:
+            logger.debug("Queueing %d messages for writing", len(batch))
+            self.writer.submit(batch)
+        return batch
 
     def process_timeouts(self):
         logger.debug("Processing timeouts")
         try:
             current_time = time.time()
-            threshold = current_time - self.inactive_timeout
-            self.cursor.execute(
-                "SELECT user_id FROM users WHERE is_active = 1 AND last_activity < ?",
-                (threshold,)
-            )
-            inactive_users = [row[0] for row in self.cursor.fetchall()]
+            inactive_users = self.activity.expire(current_time)
             if inactive_users:
-                logger.info(f"Marking {len(inactive_users)} users as inactive: {', '.join(inactive_users[:5])}...")
-                placeholders = ','.join(['?'] * len(inactive_users))
-                self.cursor.execute(
-                    f"UPDATE users SET is_active = 0 WHERE user_id IN ({placeholders})",
-                    inactive_users
-                )
-                self.conn.commit()
+                logger.info("Marking %d users as inactive: %s...", len(inactive_users), ", ".join(inactive_users[:5]))
+                self.writer.submit_deactivations(inactive_users, current_time - self.inactive_timeout)
             return inactive_users
         except Exception as e:
             logger.error(f"Error processing timeouts: {e}", exc_info=True)
             return []
 
-    def award_points_to_active_users(self, force=False, custom_points=None):
-        points = custom_points if custom_points is not None else int(self.settings.get('chat_points', 1))
-        try:
-            current_time = time.time()
-            time_since_last_award = current_time - self.last_points_award_time
-
-            if not force and time_since_last_award < self.points_award_interval:
-                logger.debug(
-                    f"Skipping points award - next award in {self.points_award_interval - time_since_last_award:.1f} seconds")
-                return False
-
-            active_users = self.get_active_users()
-            if not active_users:
-                logger.info("No active users to award points")
-                return False
-
-            user_ids = [user[0] for user in active_users]
-            logger.info(f"Awarding {points} points to {len(user_ids)} active users")
-
-            result = award_points(user_ids, points, self.settings.get('streamer_id'), self.api_client)
-
-            if result and not force:
-                self.last_points_award_time = current_time
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Error awarding points to active users: {e}", exc_info=True)
-            return False
+    def snapshot_active_users(self):
+        """Return the ids of currently active users; safe to call from any thread."""
+        return self.activity.snapshot_active()
 
     def get_active_users(self):
         logger.debug("Getting active users")
         try:
             self.process_timeouts()
-            self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            ignored_placeholders = ','.join(['?'] * len(self.ignored_users)) if self.ignored_users else "''"
-            query = "SELECT user_id, last_activity, message_count, is_member FROM users WHERE is_active = 1"
-            if self.ignored_users:
-                query += f" AND user_id NOT IN ({ignored_placeholders})"
-
-            if self.ignored_users:
-                self.cursor.execute(query, self.ignored_users)
-            else:
-                self.cursor.execute(query)
-
-            users = self.cursor.fetchall()
-            logger.debug(f"Found {len(users)} active users")
+            users = self.activity.active_users()
+            logger.debug("Found %d active users", len(users))
             return users
         except Exception as e:
             logger.error(f"Error getting active users: {e}", exc_info=True)
@@ -208,64 +351,19 @@ class YouTubeChatTracker:
         logger.debug("Getting inactive users")
         try:
             self.process_timeouts()
-            self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            ignored_placeholders = ','.join(['?'] * len(self.ignored_users)) if self.ignored_users else "''"
-            query = "SELECT user_id, last_activity, message_count, is_member FROM users WHERE is_active = 0"
-            if self.ignored_users:
-                query += f" AND user_id NOT IN ({ignored_placeholders})"
-
-            if self.ignored_users:
-                self.cursor.execute(query, self.ignored_users)
-            else:
-                self.cursor.execute(query)
-
-            users = self.cursor.fetchall()
-            logger.debug(f"Found {len(users)} inactive users")
+            users = self.activity.inactive_users()
+            logger.debug("Found %d inactive users", len(users))
             return users
         except Exception as e:
             logger.error(f"Error getting inactive users: {e}", exc_info=True)
             return []
 
-    def get_all_messages(self, limit=1000):
-        logger.debug(f"Getting all messages (limit: {limit})")
-        try:
-            self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            ignored_placeholders = ','.join(['?'] * len(self.ignored_users)) if self.ignored_users else "''"
-            query = "SELECT message_id, user_id, message, is_member, timestamp FROM messages"
-            if self.ignored_users:
-                query += f" WHERE user_id NOT IN ({ignored_placeholders})"
-            query += " ORDER BY timestamp DESC LIMIT ?"
-
-            if self.ignored_users:
-                self.cursor.execute(query, self.ignored_users + [limit])
-            else:
-                self.cursor.execute(query, [limit])
-
-            return self.cursor.fetchall()
-        except Exception as e:
-            logger.error(f"Error getting messages: {e}", exc_info=True)
-            return []
-
     def get_active_count(self):
         logger.debug("Getting active user count")
         try:
             self.process_timeouts()
-            self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            ignored_placeholders = ','.join(['?'] * len(self.ignored_users)) if self.ignored_users else "''"
-            query = "SELECT COUNT(*) FROM users WHERE is_active = 1"
-            if self.ignored_users:
-                query += f" AND user_id NOT IN ({ignored_placeholders})"
-
-            if self.ignored_users:
-                self.cursor.execute(query, self.ignored_users)
-            else:
-                self.cursor.execute(query)
-
-            count = self.cursor.fetchone()[0]
-            logger.debug(f"Active user count: {count}")
+            count = self.activity.active_count()
+            logger.debug("Active user count: %d", count)
             return count
         except Exception as e:
             logger.error(f"Error getting active count: {e}", exc_info=True)
@@ -273,25 +371,16 @@ class YouTubeChatTracker:
 
     def get_total_users(self):
         try:
-            self.ignored_users = [user.strip() for user in self.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            ignored_placeholders = ','.join(['?'] * len(self.ignored_users)) if self.ignored_users else "''"
-            query = "SELECT COUNT(*) FROM users"
-            if self.ignored_users:
-                query += f" WHERE user_id NOT IN ({ignored_placeholders})"
-
-            if self.ignored_users:
-                self.cursor.execute(query, self.ignored_users)
-            else:
-                self.cursor.execute(query)
-
-            return self.cursor.fetchone()[0]
+            return self.activity.total_count()
         except Exception as e:
             logger.error(f"Error getting total users: {e}", exc_info=True)
             return 0
 
     def shutdown(self):
         logger.info("Shutting down database connection")
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
         if self.conn:
             try:
                 self.conn.commit()
@@ -304,22 +393,140 @@ class YouTubeChatTracker:
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 
-class UserActivityTable(QtWidgets.QTableWidget):
+class UserActivityModel(QtCore.QAbstractTableModel):
+    """
+    Table model over the tracker's in-memory activity index. Rows are appended
+    for new users and only rows of users whose state changed are refreshed;
+    cell text is produced on demand for the rows the view actually paints.
+    """
+
+    HEADERS = ["Status", "User", "Msgs", "Last Active"]
+    SORT_ROLE = QtCore.Qt.UserRole
+    ACTIVE_COLOR = QtGui.QColor(0, 200, 0)
+    INACTIVE_COLOR = QtGui.QColor(200, 0, 0)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tracker = None
+        self.user_ids = []
+        self.rows = {}
+        self.generation = None
+
+    def set_tracker(self, tracker):
+        self.tracker = tracker
+        self.rebuild()
+
+    def rebuild(self):
+        self.beginResetModel()
+        if self.tracker:
+            activity = self.tracker.activity
+            activity.drain_changes()
+            self.user_ids = list(activity.users)
+            self.generation = activity.generation
+        else:
+            self.user_ids = []
+        self.rows = {user_id: row for row, user_id in enumerate(self.user_ids)}
+        self.endResetModel()
+
+    def refresh(self):
+        if not self.tracker:
+            return
+        self.tracker.process_timeouts()
+        activity = self.tracker.activity
+        if activity.generation != self.generation:
+            self.rebuild()
+            return
+        added = []
+        for user_id in activity.drain_changes():
+            row = self.rows.get(user_id)
+            if row is None:
+                if user_id in activity.users:
+                    added.append(user_id)
+            elif user_id not in activity.users:
+                # Removals only happen when the ignore list changes; rebuild rather than shift rows.
+                self.rebuild()
+                return
+            else:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        if added:
+            first = len(self.user_ids)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            for row, user_id in enumerate(added, start=first):
+                self.user_ids.append(user_id)
+                self.rows[user_id] = row
+            self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.user_ids)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or not self.tracker:
+            return None
+        activity = self.tracker.activity
+        user_id = self.user_ids[index.row()]
+        user = activity.users.get(user_id)
+        if user is None:
+            return None
+        last_activity, message_count = user[0], user[1]
+        is_active = user_id in activity.active
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            if column == 1:
+                return user_id
+            if column == 2:
+                return str(message_count)
+            if column == 3:
+                return time.strftime("%H:%M:%S", time.localtime(last_activity))
+        elif role == QtCore.Qt.BackgroundRole and column == 0:
+            return self.ACTIVE_COLOR if is_active else self.INACTIVE_COLOR
+        elif role == self.SORT_ROLE:
+            if column == 0:
+                # Active users first, each group most recent first when sorted descending.
+                return last_activity + (1e10 if is_active else 0)
+            if column == 1:
+                return user_id.casefold()
+            if column == 2:
+                return message_count
+            if column == 3:
+                return last_activity
+        return None
+
+
+class UserActivityTable(QtWidgets.QTableView):
     def __init__(self, parent=None):
         super().__init__(parent)
         logger.info("Initializing UserActivityTable")
         self.tracker = None
-        self.setColumnCount(4)
-        self.setHorizontalHeaderLabels(["Status", "User", "Msgs", "Last Active"])
+        self.activity_model = UserActivityModel(self)
+        self.proxy_model = QtCore.QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.activity_model)
+        self.proxy_model.setSortRole(UserActivityModel.SORT_ROLE)
+        self.proxy_model.setFilterKeyColumn(1)
+        self.proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.proxy_model.setDynamicSortFilter(True)
+        self.setModel(self.proxy_model)
+        self.setSortingEnabled(True)
+        self.sortByColumn(0, QtCore.Qt.DescendingOrder)
+        self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.setColumnWidth(0, 40)
         self.setColumnWidth(1, 120)
         self.setColumnWidth(2, 50)
         self.setColumnWidth(3, 120)
         self.verticalHeader().setDefaultSectionSize(20)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.verticalHeader().setVisible(False)
         self.setShowGrid(False)
         self.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #222;
                 color: white;
                 gridline-color: #444;
@@ -341,47 +548,22 @@ class UserActivityTable(QtWidgets.QTableWidget):
         """)
         self.update_timer = QtCore.QTimer(self)
         self.update_timer.timeout.connect(self.update_user_list)
-        self.update_timer.start(10000)
+        self.update_timer.start(1000)
         logger.info("UserActivityTable initialized")
 
     def set_tracker(self, tracker):
         logger.info("Setting tracker for UserActivityTable")
         self.tracker = tracker
-        self.update_user_list()
+        self.activity_model.set_tracker(tracker)
+
+    def set_filter(self, text):
+        self.proxy_model.setFilterFixedString(text)
 
     def update_user_list(self):
-        logger.debug("Updating user activity table")
         if not self.tracker:
             logger.warning("No tracker set for UserActivityTable")
             return
         try:
-            self.tracker.process_timeouts()
-            active_users = self.tracker.get_active_users()
-            inactive_users = self.tracker.get_inactive_users()
-            logger.debug(f"Updating table with {len(active_users)} active and {len(inactive_users)} inactive users")
-            self.setRowCount(0)
-            for i, (user_id, last_activity, msg_count, is_member) in enumerate(active_users):
-                self.insertRow(i)
-                status_item = QtWidgets.QTableWidgetItem()
-                status_item.setBackground(QtGui.QColor(0, 200, 0))
-                self.setItem(i, 0, status_item)
-                self.setItem(i, 1, QtWidgets.QTableWidgetItem(str(user_id)))
-                self.setItem(i, 2, QtWidgets.QTableWidgetItem(str(msg_count)))
-                timestamp = datetime.datetime.fromtimestamp(last_activity).strftime("%H:%M:%S")
-                self.setItem(i, 3, QtWidgets.QTableWidgetItem(timestamp))
-            row_count = len(active_users)
-            for j, (user_id, last_activity, msg_count, is_member) in enumerate(inactive_users):
-                row = row_count + j
-                self.insertRow(row)
-                status_item = QtWidgets.QTableWidgetItem()
-                status_item.setBackground(QtGui.QColor(200, 0, 0))
-                self.setItem(row, 0, status_item)
-                self.setItem(row, 1, QtWidgets.QTableWidgetItem(str(user_id)))
-                self.setItem(row, 2, QtWidgets.QTableWidgetItem(str(msg_count)))
-                timestamp = datetime.datetime.fromtimestamp(last_activity).strftime("%H:%M:%S")
-                self.setItem(row, 3, QtWidgets.QTableWidgetItem(timestamp))
-            logger.debug("User activity table updated successfully")
-
-            self.tracker.award_points_to_active_users()
+            self.activity_model.refresh()
         except Exception as e:
-            logger.error(f"Error updating user list: {e}", exc_info=True)
\ No newline at end of file
+            logger.error(f"Error updating user list: {e}", exc_info=True)
@@ -1,41 +1,31 @@
 # youtube_hot_word.py
-def update_hotword_html(hotword, percent, top3=None):
-    """
-    Create or update an HTML file "hot-word.html" that displays a card.
-    If top3 is provided (a list of (word, percent) tuples), it displays the top three words.
-    Otherwise, it displays the single hot word and percentage.
-    """
-    if top3:
-        rows = ""
-        for w, p in top3:
-            red = int(255 * (p / 70))
-            blue = int(255 * (1 - p / 70))
-            color = f"rgb({red}, 0, {blue})"
-            rows += f"<div><span class='hotword'>{w.upper()}</span> <span class='percent' style='color:{color};'>{p:.1f}%</span></div>\n"
-        card_content = rows
-    else:
-        if hotword is None:
-            hotword = "N/A"
-        red = int(255 * (percent / 70))
-        blue = int(255 * (1 - percent / 70))
-        color = f"rgb({red}, 0, {blue})"
-        card_content = f"<span class='hotword'>{hotword.upper()}</span> <span class='percent'>{percent:.1f}%</span>"
-
-    html = f"""<!DOCTYPE html>
+import json
+import logging
+import threading
+
+from utils.local_http_server import LocalHTTPServer, LocalRequestHandler
+from utils.metrics import METRICS
+
+logger = logging.getLogger('HotWordOverlay')
+
+DEFAULT_OVERLAY_PORT = 8765
+OVERLAY_FILE = "hot-word.html"
+KEEPALIVE_SECONDS = 15
+
+OVERLAY_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
-    <meta http-equiv="refresh" content="2">
     <title>Hot Word</title>
     <style>
-        body {{
+        body {
             margin: 0;
             padding: 0;
             font-family: Arial, sans-serif;
             background-color: #222;
             color: white;
-        }}
-        .card {{
+        }
+        .card {
             background-color: rgba(0, 49, 0, 0.76);
             padding: 20px;
             margin: 20px;
@@ -47,29 +37,193 @@ def update_hotword_html(hotword, percent, top3=None):
             gap: 10px;
             justify-content: center;
             align-items: center;
-        }}
-        .hotword {{
+        }
+        .hotword {
             font-weight: bold;
-        }}
-        .percent {{
-            color: {color};
+        }
+        .percent {
             font-weight: bold;
             text-shadow:
                1px 1px 0 #FFFFFF,
-             -1px -1px 0 #FFFFFF,  
+             -1px -1px 0 #FFFFFF,
               1px -1px 0 #FFFFFF,
               -1px 1px 0 #FFFFFF,
                1px 1px 0 #FFFFFF;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="card">
+    <div class="card" id="card">
         <span>HOT WORDS</span>
-        {card_content}
     </div>
+    <script>
+        (function () {
+            // Served over HTTP the page uses its own origin; opened as a file it falls back to the local server.
+            var EVENTS_URL = location.protocol === "file:" ? "http://127.0.0.1:__PORT__/events" : "/events";
+            var card = document.getElementById("card");
+            var rows = [];
+
+            function percentColor(percent) {
+                var ratio = Math.min(Math.max(percent / 70, 0), 1);
+                return "rgb(" + Math.round(255 * ratio) + ", 0, " + Math.round(255 * (1 - ratio)) + ")";
+            }
+
+            function createRow() {
+                var row = document.createElement("div");
+                var word = document.createElement("span");
+                var percent = document.createElement("span");
+                word.className = "hotword";
+                percent.className = "percent";
+                row.appendChild(word);
+                row.appendChild(document.createTextNode(" "));
+                row.appendChild(percent);
+                card.appendChild(row);
+                return {word: word, percent: percent, element: row};
+            }
+
+            function applyDelta(delta) {
+                while (rows.length < delta.length) {
+                    rows.push(createRow());
+                }
+                while (rows.length > delta.length) {
+                    card.removeChild(rows.pop().element);
+                }
+                for (var index in delta.changed) {
+                    var data = delta.changed[index];
+                    var row = rows[Number(index)];
+                    row.word.textContent = data.word;
+                    row.percent.textContent = data.percent.toFixed(1) + "%";
+                    row.percent.style.color = percentColor(data.percent);
+                }
+            }
+
+            var source = new EventSource(EVENTS_URL);
+            source.onmessage = function (event) {
+                applyDelta(JSON.parse(event.data));
+            };
+        })();
+    </script>
 </body>
 </html>
 """
-    with open("hot-word.html", "w", encoding="utf-8") as f:
-        f.write(html)
+
+
+def render_overlay_html(port):
+    return OVERLAY_HTML.replace("__PORT__", str(port))
+
+
+def write_overlay_file(port, filename=OVERLAY_FILE):
+    """Write the static overlay page once, for OBS browser sources that point at the local file."""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(render_overlay_html(port))
+
+
+class OverlayRequestHandler(LocalRequestHandler):
+    logger = logger
+    server_version = "HotWordOverlay/1.0"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/" + OVERLAY_FILE):
+            self.send_page()
+        elif path == "/events":
+            self.stream_events()
+        else:
+            self.send_error(404)
+
+    def send_page(self):
+        body = render_overlay_html(self.server.owner.port).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        overlay = self.server.owner
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        seen_version = None
+        try:
+            while not overlay.stopping:
+                version, payload = overlay.wait_for_update(seen_version, KEEPALIVE_SECONDS)
+                if payload is None:
+                    self.wfile.write(b": keepalive\n\n")
+                else:
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+                    seen_version = version
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            logger.debug("Overlay client disconnected")
+
+
+class HotWordOverlayServer(LocalHTTPServer):
+    """
+    Local HTTP server for the OBS hot-word overlay. Serves the static overlay
+    page and a Server-Sent Events stream at /events. Clients get the full state
+    on connect and afterwards only the rows that changed.
+    """
+
+    handler_class = OverlayRequestHandler
+    thread_name = "HotWordOverlay"
+
+    def __init__(self, port=DEFAULT_OVERLAY_PORT, host="127.0.0.1"):
+        super().__init__(port, host)
+        self.stopping = False
+        self.condition = threading.Condition()
+        self.version = 0
+        self.rows = []
+        self.last_delta = None
+
+    @property
+    def url(self):
+        return f"{self.base_url}/"
+
+    def start(self):
+        super().start()
+        logger.info(f"Hot-word overlay served at {self.url}")
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        super().stop()
+
+    def publish(self, hot_words):
+        """Publish a list of (word, percent) tuples. Unchanged lists are not pushed."""
+        with METRICS.timed("overlay_render", len(hot_words)):
+            rows = [{"word": word.upper(), "percent": round(float(percent), 1)} for word, percent in hot_words]
+            with self.condition:
+                if rows == self.rows:
+                    return False
+                changed = {str(index): row for index, row in enumerate(rows)
+                           if index >= len(self.rows) or self.rows[index] != row}
+                self.rows = rows
+                self.last_delta = {"length": len(rows), "changed": changed}
+                self.version += 1
+                self.condition.notify_all()
+            return True
+
+    def snapshot(self):
+        return {"length": len(self.rows), "changed": {str(index): row for index, row in enumerate(self.rows)}}
+
+    def wait_for_update(self, seen_version, timeout):
+        """
+        Block until there is something newer than seen_version. Returns the new
+        version and the payload to send, or (seen_version, None) on timeout.
+        """
+        with self.condition:
+            if seen_version is None:
+                return self.version, self.snapshot()
+            if self.version == seen_version:
+                self.condition.wait_for(lambda: self.version != seen_version or self.stopping, timeout)
+            if self.version == seen_version:
+                return seen_version, None
+            if self.version == seen_version + 1:
+                return self.version, self.last_delta
+            # The client missed intermediate deltas; resend the whole state.
+            return self.version, self.snapshot()
@@ -0,0 +1,274 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+
+import requests
+from PyQt5 import QtCore
+
+from utils.environment import is_dev
+
+logger = logging.getLogger('LiveStreamWatcher')
+
+YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
+DEV_VIDEO_ID = 'NIYOTPN-KKs'
+REQUEST_TIMEOUT = (3.05, 10)
+QUOTA_FILE = "youtube_quota.json"
+DEFAULT_DAILY_QUOTA = 10000
+RECENT_UPLOADS = 10
+
+# A check costs at most 2 units, so a full day live costs 86400 / 120 * 2 = 1440 units and a day
+# offline at the 15 minute ceiling about 96-192, well inside the default 10,000 unit quota.
+LIVE_RECHECK_SECONDS = 120
+OFFLINE_MIN_SECONDS = 60
+OFFLINE_MAX_SECONDS = 900
+ERROR_MAX_SECONDS = 1800
+STOP_TIMEOUT = 1.0
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # Frozen Windows builds may lack tz data; Pacific standard time is close enough for a budget.
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+class QuotaExceeded(Exception):
+    pass
+
+
+class QuotaBudget:
+    """
+    Tracks YouTube Data API units spent today against a daily budget. The
+    count is persisted so restarts do not forget it, and resets at midnight
+    Pacific time like the API quota itself.
+    """
+
+    def __init__(self, daily_budget=DEFAULT_DAILY_QUOTA, state_file=QUOTA_FILE):
+        self.daily_budget = daily_budget
+        self.state_file = state_file
+        self.lock = threading.Lock()
+        self.day, self.used = self.load()
+
+    @staticmethod
+    def today():
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    def load(self):
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            return state.get("day"), int(state.get("used", 0))
+        except FileNotFoundError:
+            return self.today(), 0
+        except Exception as e:
+            logger.error(f"Error reading quota state, starting from zero: {e}")
+            return self.today(), 0
+
+    def save(self):
+        try:
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump({"day": self.day, "used": self.used}, f)
+        except OSError as e:
+            logger.error(f"Error saving quota state: {e}")
+
+    def roll_over(self):
+        today = self.today()
+        if today != self.day:
+            self.day, self.used = today, 0
+
+    def remaining(self):
+        with self.lock:
+            self.roll_over()
+            return max(0, self.daily_budget - self.used)
+
+    def spend(self, units):
+        with self.lock:
+            self.roll_over()
+            if self.used + units > self.daily_budget:
+                raise QuotaExceeded(f"YouTube API budget of {self.daily_budget} units for {self.day} is used up")
+            self.used += units
+            self.save()
+
+    def seconds_until_reset(self):
+        now = datetime.now(QUOTA_TIMEZONE)
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo)
+        return max(1.0, (midnight - now).total_seconds())
+
+    def min_interval(self, units_per_check):
+        """Shortest polling interval that keeps today's remaining budget from running out before reset."""
+        remaining = self.remaining()
+        if remaining < units_per_check:
+            return self.seconds_until_reset()
+        return self.seconds_until_reset() / (remaining // units_per_check)
+
+
+class LiveStatusChecker:
+    """
+    Finds the channel's live video using 1-unit API calls instead of the
+    100-unit ``search.list``: the newest entries of the channel's uploads
+    playlist are listed, and only ids whose state is not already known are
+    looked up with ``videos.list``. Uploads that have finished streaming, or
+    were never streams, are cached for good, so a check on an idle channel
+    usually costs a single unit. The playlist request carries the last ETag
+    and a 304 reuses the cached listing.
+    """
+
+    def __init__(self, api_key, api_base=YOUTUBE_API_BASE, budget=None):
+        self.api_key = api_key
+        self.api_base = api_base.rstrip("/")
+        self.budget = budget or QuotaBudget()
+        self.session = requests.Session()
+        self.playlist_cache = {}  # playlist_id -> (etag, [video_id, ...])
+        self.finished_videos = set()
+
+    @staticmethod
+    def uploads_playlist_id(yt_channel):
+        # A channel's uploads playlist is its id with the "UC" prefix replaced by "UU".
+        return "UU" + yt_channel[2:] if yt_channel.startswith("UC") else yt_channel
+
+    def api_get(self, resource, params, etag=None):
+        self.budget.spend(1)
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.session.get(f"{self.api_base}/{resource}", params=dict(params, key=self.api_key),
+                                    headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def recent_uploads(self, yt_channel):
+        playlist_id = self.uploads_playlist_id(yt_channel)
+        etag, video_ids = self.playlist_cache.get(playlist_id, (None, []))
+        data = self.api_get("playlistItems", {
+            "part": "contentDetails",
+            "playlistId": playlist_id,
+            "maxResults": RECENT_UPLOADS,
+        }, etag)
+        if data is not None:
+            video_ids = [item["contentDetails"]["videoId"] for item in data.get("items", [])]
+            self.playlist_cache[playlist_id] = (data.get("etag"), video_ids)
+        return video_ids
+
+    def get_live_video_id(self, yt_channel):
+        candidates = [video_id for video_id in self.recent_uploads(yt_channel)
+                      if video_id not in self.finished_videos]
+        if not candidates:
+            return None
+        data = self.api_get("videos", {"part": "liveStreamingDetails", "id": ",".join(candidates)})
+        live_video_id = None
+        for video in data.get("items", []):
+            details = video.get("liveStreamingDetails")
+            if not details or details.get("actualEndTime"):
+                self.finished_videos.add(video["id"])
+            elif details.get("actualStartTime") and live_video_id is None:
+                live_video_id = video["id"]
+        return live_video_id
+
+
+class LiveStreamWatcher(QtCore.QObject):
+    """
+    Polls the channel's live status on a background thread. Polling is slowed
+    further if needed to keep within the day's API quota budget.
+
+    While live the status is re-checked every LIVE_RECHECK_SECONDS to notice
+    the stream ending or restarting under a new id. While offline the interval
+    grows from OFFLINE_MIN_SECONDS to OFFLINE_MAX_SECONDS, and starts over when
+    a stream has just ended since a restart is likely. Errors back off
+    exponentially. ``live_changed`` is emitted with the new video id, or an
+    empty string when the stream goes offline.
+    """
+
+    live_changed = QtCore.pyqtSignal(str)
+    check_failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, yt_channel, api_key, api_base=YOUTUBE_API_BASE, daily_quota=DEFAULT_DAILY_QUOTA, parent=None):
+        super().__init__(parent)
+        self.yt_channel = yt_channel
+        self.api_key = api_key
+        self.api_base = api_base or YOUTUBE_API_BASE
+        self.budget = QuotaBudget(daily_quota)
+        self.checker = LiveStatusChecker(api_key, self.api_base, self.budget)
+        self.video_id = None
+        self.offline_interval = OFFLINE_MIN_SECONDS
+        self.error_interval = OFFLINE_MIN_SECONDS
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="LiveStreamWatcher", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        # A check may be mid-request; the thread is a daemon, so do not hold up closing for it.
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(STOP_TIMEOUT)
+
+    def configure(self, yt_channel, api_key, api_base=YOUTUBE_API_BASE, daily_quota=DEFAULT_DAILY_QUOTA):
+        """Apply changed channel, key, API base or daily quota and re-check right away."""
+        api_base = api_base or YOUTUBE_API_BASE
+        with self.lock:
+            if (yt_channel, api_key, api_base, daily_quota) == (
+                    self.yt_channel, self.api_key, self.api_base, self.budget.daily_budget):
+                return
+            self.yt_channel = yt_channel
+            self.api_key = api_key
+            self.api_base = api_base
+            with self.budget.lock:
+                self.budget.daily_budget = daily_quota
+            self.checker = LiveStatusChecker(api_key, self.api_base, self.budget)
+        self.check_now()
+
+    def check_now(self):
+        self.offline_interval = OFFLINE_MIN_SECONDS
+        self.wake.set()
+
+    def run(self):
+        while not self.stopping:
+            delay = self.check()
+            self.wake.wait(delay)
+            self.wake.clear()
+
+    def check(self):
+        """Run one live check and return the number of seconds until the next one."""
+        with self.lock:
+            yt_channel, checker = self.yt_channel, self.checker
+        if not yt_channel:
+            return OFFLINE_MAX_SECONDS
+        try:
+            if is_dev() and self.api_base == YOUTUBE_API_BASE:
+                video_id = DEV_VIDEO_ID
+            else:
+                video_id = checker.get_live_video_id(yt_channel)
+        except QuotaExceeded as e:
+            logger.error(str(e))
+            self.check_failed.emit(str(e))
+            return self.budget.seconds_until_reset()
+        except Exception as e:
+            logger.error(f"Live status check failed: {e}")
+            self.check_failed.emit(str(e))
+            delay = self.error_interval
+            self.error_interval = min(ERROR_MAX_SECONDS, self.error_interval * 2)
+            return delay
+        self.error_interval = OFFLINE_MIN_SECONDS
+
+        if video_id:
+            delay = LIVE_RECHECK_SECONDS
+        elif self.video_id:
+            # The stream just ended; check often for a restart.
+            delay = self.offline_interval = OFFLINE_MIN_SECONDS
+        else:
+            delay = self.offline_interval
+            self.offline_interval = min(OFFLINE_MAX_SECONDS, int(self.offline_interval * 1.5))
+        # A check costs at most two units; never poll faster than the budget allows.
+        delay = max(delay, self.budget.min_interval(2))
+
+        with self.lock:
+            previous = self.video_id
+            self.video_id = video_id
+        if video_id != previous:
+            logger.info(f"Live status changed: {previous} -> {video_id}")
+            self.live_changed.emit(video_id or "")
+        return delay
@@ -0,0 +1,146 @@
+"""
+Local stand-in for the parts of the YouTube Data API used for live detection
+(``playlistItems.list`` and ``videos.list``), for testing without a real key or
+quota. Point the ``youtube_api_base`` setting at it, e.g.
+
+    python -m tabs.youtube_watcher.youtube_mock_api --port 8766 --live abc123XYZ00
+
+and set ``youtube_api_base`` to ``http://127.0.0.1:8766/youtube/v3``. Typing a
+video id on stdin switches the live stream to it; an empty line ends it.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from urllib.parse import parse_qs, urlparse
+
+from utils.local_http_server import LocalHTTPServer, LocalRequestHandler
+
+logger = logging.getLogger('YouTubeMockAPI')
+
+DEFAULT_MOCK_PORT = 8766
+
+
+class MockYouTubeState:
+    """Uploads of a single mock channel, newest first, and which of them is live."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.uploads = ["mockVideo01", "mockVideo02"]
+        self.live_video_id = None
+        self.ended = set(self.uploads)
+        self.calls = {}
+
+    def go_live(self, video_id):
+        with self.lock:
+            if self.live_video_id:
+                self.ended.add(self.live_video_id)
+            if video_id not in self.uploads:
+                self.uploads.insert(0, video_id)
+            self.ended.discard(video_id)
+            self.live_video_id = video_id
+
+    def end_stream(self):
+        with self.lock:
+            if self.live_video_id:
+                self.ended.add(self.live_video_id)
+            self.live_video_id = None
+
+    def count_call(self, resource):
+        with self.lock:
+            self.calls[resource] = self.calls.get(resource, 0) + 1
+
+    def playlist_items(self, max_results):
+        with self.lock:
+            items = [{"contentDetails": {"videoId": video_id}} for video_id in self.uploads[:max_results]]
+        body = json.dumps(items, sort_keys=True).encode("utf-8")
+        return {"etag": hashlib.sha1(body).hexdigest(), "items": items}
+
+    def videos(self, video_ids):
+        items = []
+        with self.lock:
+            for video_id in video_ids:
+                if video_id not in self.uploads:
+                    continue
+                details = {"actualStartTime": "2024-01-01T00:00:00Z"}
+                if video_id in self.ended:
+                    details["actualEndTime"] = "2024-01-01T01:00:00Z"
+                items.append({"id": video_id, "liveStreamingDetails": details})
+        return {"items": items}
+
+
+class MockYouTubeHandler(LocalRequestHandler):
+    logger = logger
+    server_version = "YouTubeMockAPI/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        state = self.server.owner.state
+        resource = url.path.rstrip("/").rsplit("/", 1)[-1]
+        state.count_call(resource)
+        if resource == "playlistItems":
+            payload = state.playlist_items(int(params.get("maxResults", 5)))
+            if self.headers.get("If-None-Match") == payload["etag"]:
+                self.send_response(304)
+                self.end_headers()
+                return
+        elif resource == "videos":
+            payload = state.videos([video_id for video_id in params.get("id", "").split(",") if video_id])
+        else:
+            self.send_error(404)
+            return
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockYouTubeServer(LocalHTTPServer):
+    handler_class = MockYouTubeHandler
+    thread_name = "YouTubeMockAPI"
+
+    def __init__(self, port=DEFAULT_MOCK_PORT, host="127.0.0.1"):
+        super().__init__(port, host)
+        self.state = MockYouTubeState()
+
+    @property
+    def api_base(self):
+        return f"{self.base_url}/youtube/v3"
+
+    def start(self):
+        super().start()
+        logger.info(f"Mock YouTube API served at {self.api_base}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock YouTube Data API for live detection.")
+    parser.add_argument("--port", type=int, default=DEFAULT_MOCK_PORT)
+    parser.add_argument("--live", help="video id that is live at startup")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockYouTubeServer(args.port)
+    if args.live:
+        server.state.go_live(args.live)
+    server.start()
+    print(f"Set youtube_api_base to {server.api_base}")
+    try:
+        while True:
+            video_id = input("live video id (empty to end stream)> ").strip()
+            if video_id:
+                server.state.go_live(video_id)
+            else:
+                server.state.end_stream()
+            print(f"Calls so far: {server.state.calls}")
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import logging
+import queue
+import threading
+import time
+import uuid
+
+from PyQt5 import QtCore
+
+from utils.api_points import DEFAULT_CHUNK_SIZE, DEFAULT_UPLOAD_WORKERS
+from utils.points_outbox import PointsOutbox
+from utils.settings_values import int_setting
+
+logger = logging.getLogger('PointsAwardScheduler')
+
+
+class PointsAwardScheduler(QtCore.QObject):
+    """
+    Awards points to active chat users on a fixed interval, independent of any
+    GUI timer. Interval boundaries are measured with the monotonic clock. Each
+    award is written to the durable PointsOutbox, whose worker delivers it and
+    retries failures; every delivery attempt is reported through
+    ``award_finished`` (success, user count, points, manual).
+    """
+
+    award_finished = QtCore.pyqtSignal(bool, int, int, bool)
+
+    def __init__(self, tracker, settings, parent=None):
+        super().__init__(parent)
+        self.tracker = tracker
+        self.settings = settings
+        self.interval = tracker.inactive_timeout
+        self.next_award_at = time.monotonic() + self.interval
+        # Interval keys count monotonic boundaries within this run, so wall-clock steps cannot
+        # give two intervals the same key; the run id keeps them distinct across restarts.
+        self.run_id = uuid.uuid4().hex[:12]
+        self.interval_index = 0
+        self.manual_awards = queue.Queue()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="PointsAwardScheduler", daemon=True)
+        self.outbox = PointsOutbox(
+            tracker.api_client,
+            on_result=self.on_delivery_result,
+            chunk_size=int_setting(settings, 'points_chunk_size', DEFAULT_CHUNK_SIZE),
+            upload_workers=int_setting(settings, 'points_upload_workers', DEFAULT_UPLOAD_WORKERS),
+            compress=settings.get('points_gzip') == "true")
+
+    def start(self):
+        logger.info(f"Starting points award scheduler (every {self.interval}s)")
+        self.outbox.start()
+        self.thread.start()
+
+    def stop(self):
+        """Stop scheduling awards. The outbox keeps delivering until it is stopped separately."""
+        self.stopping = True
+        self.wake.set()
+        self.thread.join()
+
+    def seconds_until_next(self):
+        return max(0.0, self.next_award_at - time.monotonic())
+
+    def award_now(self, points):
+        """Queue an immediate award of the given points to all active users."""
+        self.manual_awards.put(points)
+        self.wake.set()
+
+    def run(self):
+        while not self.stopping:
+            self.wake.wait(self.seconds_until_next())
+            self.wake.clear()
+            if self.stopping:
+                break
+            while True:
+                try:
+                    points = self.manual_awards.get_nowait()
+                except queue.Empty:
+                    break
+                self.award(points)
+            now = time.monotonic()
+            if now >= self.next_award_at:
+                # Skip boundaries missed while a slow award was in flight rather than bursting.
+                while self.next_award_at <= now:
+                    self.next_award_at += self.interval
+                    self.interval_index += 1
+                interval_key = f"interval-{self.run_id}-{self.interval_index}"
+                self.award(int(self.settings.get('chat_points', 1) or 1), interval_key)
+
+    def award(self, points, interval_key=None):
+        manual = interval_key is None
+        if manual:
+            interval_key = f"manual-{uuid.uuid4().hex}"
+        try:
+            user_ids = self.tracker.snapshot_active_users()
+            if not user_ids:
+                logger.info("No active users to award points")
+                self.award_finished.emit(False, 0, points, manual)
+                return
+            logger.info(f"Queueing {points} points for {len(user_ids)} active users ({interval_key})")
+            self.outbox.enqueue(user_ids, points, self.settings.get('streamer_id'), interval_key)
+        except Exception as e:
+            logger.error(f"Error awarding points to active users: {e}", exc_info=True)
+            self.award_finished.emit(False, 0, points, manual)
+
+    def on_delivery_result(self, success, user_count, points, interval_key):
+        self.award_finished.emit(success, user_count, points, interval_key.startswith("manual-"))
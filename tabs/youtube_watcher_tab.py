@@ -1,11 +1,17 @@
-import datetime
+import logging
 import time
 from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 
-from tabs.youtube_watcher.youtube_chat import get_live_video_id, analyze_hot_message, analyze_top_messages
+from tabs.youtube_watcher.youtube_chat import HotMessageWindow, HotTokenCounter
+from tabs.youtube_watcher.youtube_chat_poller import LiveChatPoller
+from tabs.kick_watcher.kick_chat import KickChatClient
+from tabs.youtube_watcher.youtube_dedup import RecentMessageIds
 from tabs.youtube_watcher.youtube_helper import YouTubeChatTracker, UserActivityTable
-from tabs.youtube_watcher.youtube_hot_word import update_hotword_html
+from tabs.youtube_watcher.youtube_live import DEFAULT_DAILY_QUOTA, LiveStreamWatcher
+from tabs.youtube_watcher.youtube_points import PointsAwardScheduler
+from tabs.youtube_watcher.youtube_hot_word import DEFAULT_OVERLAY_PORT, HotWordOverlayServer, write_overlay_file
+from utils.metrics import METRICS
+from utils.settings_values import int_setting
 
 
 class YouTubeWatcherTab(QtWidgets.QWidget):
@@ -13,8 +19,6 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         super().__init__()
         self.parent = parent
         self.parent.log_status("Initializing YouTubeWatcherTab")
-        self.ignored_users = [user.strip() for user in self.parent.settings.get('ignored_users', '').split(',') if
-                              user.strip()]
         self.message_count = 0
         try:
             self.chat_tracker = YouTubeChatTracker(parent.settings)
@@ -22,7 +26,23 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         except Exception as e:
             self.parent.log_status(f"Failed to initialize chat tracker: {e}")
             self.parent.log_status(f"Error initializing database: {e}")
-        self.seen_message_ids = set()
+        self.seen_message_ids = RecentMessageIds(use_bloom=self.parent.settings.get('dedup_bloom') == "true")
+        self.hot_messages = HotMessageWindow(
+            max_messages=int_setting(self.parent.settings, 'hotword_window_messages', 100),
+            max_age=int_setting(self.parent.settings, 'hotword_window_seconds', 0, minimum=0),
+        )
+        self.hot_tokens = HotTokenCounter(
+            max_messages=self.hot_messages.max_messages,
+            max_age=self.hot_messages.max_age,
+        )
+        self.overlay_server = HotWordOverlayServer(
+            port=int_setting(self.parent.settings, 'overlay_port', DEFAULT_OVERLAY_PORT, maximum=65535))
+        try:
+            self.overlay_server.start()
+            write_overlay_file(self.overlay_server.port)
+            self.parent.log_status(f"Hot-word overlay available at {self.overlay_server.url}")
+        except OSError as e:
+            self.parent.log_status(f"Failed to start hot-word overlay server: {e}")
         self.last_hotword = None
         self.last_percent = None
         self.last_top3 = None
@@ -38,6 +58,14 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         self.top3_checkbox = QtWidgets.QCheckBox("TOP 3")
         self.top3_checkbox.setStyleSheet("font-size: 9pt;")
 
+        self.words_checkbox = QtWidgets.QCheckBox("WORDS")
+        self.words_checkbox.setStyleSheet("font-size: 9pt;")
+        self.words_checkbox.setToolTip("Rank individual words and word pairs instead of whole messages")
+
+        self.hotword_options_layout = QtWidgets.QHBoxLayout()
+        self.hotword_options_layout.addWidget(self.top3_checkbox)
+        self.hotword_options_layout.addWidget(self.words_checkbox)
+
         self.active_users_label = QtWidgets.QLabel("Active Users: 0")
         self.active_users_label.setAlignment(QtCore.Qt.AlignCenter)
         self.active_users_label.setStyleSheet("font-size: 9pt;")
@@ -50,8 +78,7 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         self.timeout_label.setAlignment(QtCore.Qt.AlignCenter)
         self.timeout_label.setStyleSheet("font-size: 9pt;")
 
-        self.ignored_label = QtWidgets.QLabel(
-            f"Ignored: {', '.join(self.ignored_users)}")
+        self.ignored_label = QtWidgets.QLabel("Ignored: ")
         self.ignored_label.setAlignment(QtCore.Qt.AlignCenter)
         self.ignored_label.setWordWrap(True)
         self.ignored_label.setStyleSheet("font-size: 9pt;")
@@ -75,7 +102,7 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         left_layout.setContentsMargins(2, 2, 2, 2)
         left_layout.setSpacing(4)
         left_layout.addWidget(self.hotword_display)
-        left_layout.addWidget(self.top3_checkbox)
+        left_layout.addLayout(self.hotword_options_layout)
         left_layout.addWidget(self.active_users_label)
         left_layout.addWidget(self.message_count_label)
         left_layout.addWidget(self.timeout_label)
@@ -91,15 +118,28 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         try:
             self.user_activity_table = UserActivityTable()
             self.user_activity_table.set_tracker(self.chat_tracker)
-            self.splitter.addWidget(self.user_activity_table)
+            self.user_filter_input = QtWidgets.QLineEdit()
+            self.user_filter_input.setPlaceholderText("Filter users")
+            self.user_filter_input.textChanged.connect(self.user_activity_table.set_filter)
+
+            users_layout = QtWidgets.QVBoxLayout()
+            users_layout.setContentsMargins(0, 0, 0, 0)
+            users_layout.setSpacing(2)
+            users_layout.addWidget(self.user_filter_input)
+            users_layout.addWidget(self.user_activity_table)
+            users_widget = QtWidgets.QWidget()
+            users_widget.setLayout(users_layout)
+            self.splitter.addWidget(users_widget)
             self.parent.log_status("User activity table initialized successfully")
         except Exception as e:
             self.parent.log_status(f"Failed to initialize user activity table: {e}", exc_info=True)
             self.parent.log_status(f"Error setting up user activity table: {e}")
 
-        self.chat_view = QWebEngineView()
-        self.chat_view.setZoomFactor(0.8)
-        self.splitter.addWidget(self.chat_view)
+        self.chat_backend = self.parent.settings.get("chat_backend") or "browser"
+        if self.chat_backend == "http":
+            self.init_http_chat()
+        else:
+            self.init_browser_chat()
 
         self.splitter.setSizes([200, 250, 800])
 
@@ -107,27 +147,47 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
         main_layout.setContentsMargins(2, 2, 2, 2)
         main_layout.addWidget(self.splitter)
 
+        self.points_scheduler = PointsAwardScheduler(self.chat_tracker, self.parent.settings, self)
+        self.points_scheduler.award_finished.connect(self.on_points_awarded)
+        self.points_scheduler.start()
+
         self.stats_timer = QtCore.QTimer(self)
         self.stats_timer.timeout.connect(self.update_user_stats)
         self.stats_timer.start(1000)
 
+        self.attached_video_id = None
+        self.live_watcher = LiveStreamWatcher(
+            self.parent.settings.get("yt_channel", ""),
+            self.parent.settings.get("youtube_api", ""),
+            api_base=self.parent.settings.get("youtube_api_base", ""),
+            daily_quota=int_setting(self.parent.settings, "youtube_daily_quota", DEFAULT_DAILY_QUOTA),
+            parent=self)
+        self.live_watcher.live_changed.connect(self.on_live_changed)
+        self.live_watcher.check_failed.connect(
+            lambda error: self.parent.log_status("Error while checking live status: " + error))
+
+        self.kick_client = None
+        self.start_kick_chat(self.parent.settings)
+
+        self.parent.settings_changed.connect(self.on_settings_changed)
+
         self.parent.log_status("YouTubeWatcherTab initialization complete")
         self.load_settings()
+        self.live_watcher.start()
 
     def update_user_stats(self):
         try:
             active_count = self.chat_tracker.get_active_count()
             self.active_users_label.setText(f"Active Users: {active_count}")
 
-            current_time = int(time.time())
-            last_award_time = int(self.chat_tracker.last_points_award_time)
-            interval = int(self.chat_tracker.points_award_interval)
-
-            seconds_left = max(0, (last_award_time + interval) - current_time)
+            seconds_left = int(round(self.points_scheduler.seconds_until_next()))
             minutes = seconds_left // 60
             seconds = seconds_left % 60
 
             self.points_countdown_label.setText(f"Points Update in: {minutes:02d}:{seconds:02d}")
+
+            if self.hot_messages.max_age:
+                self.update_hotwords()
         except Exception as e:
             self.parent.log_status(f"Error updating user stats: {e}", exc_info=True)
 
@@ -139,156 +199,244 @@ class YouTubeWatcherTab(QtWidgets.QWidget):
                 return
 
             points = int(points_text)
-            success = self.chat_tracker.award_points_to_active_users(force=True, custom_points=points)
+            self.points_scheduler.award_now(points)
+            self.points_input.clear()
+        except Exception as e:
+            self.parent.log_status(f"Error adding points: {e}")
 
-            if success:
+    def on_points_awarded(self, success, user_count, points, manual):
+        if success:
+            if manual:
                 self.parent.log_status(f"Successfully added {points} points to all active users")
-                self.points_input.clear()
             else:
-                self.parent.log_status("Failed to add points to users")
-        except Exception as e:
-            self.parent.log_status(f"Error adding points: {e}")
+                self.parent.log_status(f"Awarded {points} points to {user_count} active users")
+        elif user_count:
+            self.parent.log_status(f"Failed to award {points} points to {user_count} users, retry queued")
+        elif manual:
+            self.parent.log_status("No active users to add points to")
+
+    def init_browser_chat(self):
+        # QtWebEngine is only imported when the embedded browser backend is used
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        from tabs.youtube_watcher.youtube_chat_bridge import ChatBridge, install_chat_bridge
+
+        self.chat_view = QWebEngineView()
+        self.chat_view.setZoomFactor(0.8)
+        self.chat_view.loadFinished.connect(self.onChatLoadFinished)
+        self.splitter.addWidget(self.chat_view)
+
+        self.chat_bridge = ChatBridge(self)
+        self.chat_bridge.messages_received.connect(self.handleChatMessages)
+        self.chat_channel = install_chat_bridge(self.chat_view, self.chat_bridge)
+
+    def init_http_chat(self):
+        self.chat_status_label = QtWidgets.QLabel("Headless chat: waiting for a live stream")
+        self.chat_status_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.chat_status_label.setWordWrap(True)
+        self.splitter.addWidget(self.chat_status_label)
+
+        self.chat_poller = LiveChatPoller(self.parent.settings.get("youtube_web_base", ""), self)
+        self.chat_poller.messages_received.connect(self.handleChatMessages)
+        self.chat_poller.poll_failed.connect(lambda error: self.parent.log_status(f"Chat poll failed: {error}"))
+        self.chat_poller.chat_ended.connect(self.on_chat_ended)
+
+    @staticmethod
+    def kick_settings(settings):
+        return (settings.get("kick_channel", "").strip(), settings.get("kick_pusher_url", ""),
+                settings.get("kick_api_base", ""))
+
+    def start_kick_chat(self, settings):
+        """(Re)connect Kick chat for the configured channel; Kick users share the tracker under a 'kick:' prefix."""
+        self.kick_started_with = dict(settings)
+        if self.kick_client is not None:
+            self.kick_client.stop()
+            self.kick_client = None
+        kick_channel = settings.get("kick_channel", "").strip()
+        if not kick_channel:
+            return
+        self.parent.log_status(f"Connecting to Kick chat for channel: {kick_channel}")
+        self.kick_client = KickChatClient(
+            kick_channel,
+            pusher_url=settings.get("kick_pusher_url", ""),
+            api_base=settings.get("kick_api_base", ""),
+            parent=self)
+        self.kick_client.messages_received.connect(self.handleChatMessages)
+        self.kick_client.status_changed.connect(self.parent.log_status)
+        self.kick_client.start()
+
+    def shutdown(self):
+        """
+        Stop background work before the app exits: flush queued chat rows to
+        the database, stop scheduling awards, let the outbox finish its
+        delivery in flight (it shares the API session), then stop the chat
+        sources, live detection and the overlay server.
+        """
+        self.stats_timer.stop()
+        self.chat_tracker.shutdown()
+        self.points_scheduler.stop()
+        self.points_scheduler.outbox.stop()
+        if self.kick_client is not None:
+            self.kick_client.stop()
+            self.kick_client = None
+        if self.chat_backend == "http":
+            self.chat_poller.stop()
+        self.live_watcher.stop()
+        self.overlay_server.stop()
+
+    def on_chat_ended(self, video_id):
+        self.parent.log_status(f"Live chat for {video_id} ended")
+        self.chat_status_label.setText("Headless chat: waiting for a live stream")
+        self.attached_video_id = None
+        self.live_watcher.check_now()
 
     def onChatLoadFinished(self, ok):
         if ok:
-            self.parent.log_status("Chat page loaded successfully")
-            self.parent.log_status("Chat page loaded successfully. Starting extraction...")
-            self.chat_timer = QtCore.QTimer(self)
-            self.chat_timer.timeout.connect(self.extractChatMessages)
-            self.chat_timer.start(1000)
+            self.parent.log_status("Chat page loaded successfully. Waiting for pushed messages...")
         else:
-            self.parent.log_status("Failed to load chat page")
             self.parent.log_status("Failed to load chat page.")
 
-    def extractChatMessages(self):
-        js_extract = """
-        (function(){
-            var messages = [];
-            var chatElements = document.querySelectorAll("yt-live-chat-text-message-renderer");
-            for (var i = 0; i < chatElements.length; i++) {
-                var msgId = chatElements[i].id;
-                var userElem = chatElements[i].querySelector("#author-name");
-                var messageElem = chatElements[i].querySelector("#message");
-                var memberBadge = chatElements[i].querySelector("yt-live-chat-author-badge-renderer");
-
-                var user = userElem ? userElem.innerText.trim() : "Unknown";
-                var msg = messageElem ? messageElem.innerText.trim() : "";
-                var member = memberBadge ? "Yes" : "No";
-
-                messages.push(msgId + "||" + user + "||" + msg + "||" + member);
-            }
-            messages.reverse();
-            return messages.join("\\n");
-        })();
-        """
-        try:
-            self.chat_view.page().runJavaScript(js_extract, self.handleChatMessages)
-        except Exception as e:
-            self.parent.log_status(f"Error executing JavaScript for chat extraction: {e}", exc_info=True)
-            self.parent.log_status(f"Error extracting chat: {e}")
-
-    def handleChatMessages(self, result):
+    def handleChatMessages(self, records):
         try:
-            if result is not None:
-                new_msgs = result.split("\n")
-                new_msg_count = 0
-                self.ignored_users = [user.strip() for user in self.parent.settings.get('ignored_users', '').split(',')
-                                      if user.strip()]
-                for msg in new_msgs:
-                    parts = msg.split("||")
-                    if len(parts) == 4:
-                        msg_id, user, message, member_status = parts
-                        if user in self.ignored_users:
-                            continue
-                        if msg_id not in self.seen_message_ids:
-                            self.seen_message_ids.add(msg_id)
-                            self.process_message(msg_id, user, message, member_status)
-                            new_msg_count += 1
-                if new_msg_count > 0:
-                    self.message_count += new_msg_count
-                    self.message_count_label.setText(f"Messages: {self.message_count} added")
-                    self.parent.log_status(f"Added {new_msg_count} new messages")
-                self.update_hotwords()
-            else:
-                self.parent.log_status("No chat messages extracted")
-                self.parent.log_status("No chat messages extracted.")
+            batch = []
+            with METRICS.timed("dedup", len(records)):
+                for record in records:
+                    msg_id = record.get("message_id")
+                    if not msg_id:
+                        continue
+                    if not self.seen_message_ids.check_and_add(msg_id):
+                        batch.append(self.process_message(record))
+            accepted = self.chat_tracker.add_messages(batch) if batch else []
+            new_msg_count = len(accepted)
+            if new_msg_count > 0:
+                with METRICS.timed("hotword_analysis", new_msg_count):
+                    for msg in accepted:
+                        self.hot_messages.add(msg["message"], msg["received_at"])
+                        self.hot_tokens.add(msg["message"], msg["received_at"])
+                    self.update_hotwords()
+                self.message_count += new_msg_count
+                self.message_count_label.setText(f"Messages: {self.message_count} added")
+                self.parent.log_status(f"Added {new_msg_count} new messages", logging.DEBUG)
         except Exception as e:
-            self.parent.log_status(f"Error handling chat messages: {e}", exc_info=True)
             self.parent.log_status(f"Error processing chat messages: {e}")
 
-    def process_message(self, msg_id, user, message, member_status):
-        try:
-            if user in self.ignored_users:
-                return False
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            success = self.chat_tracker.add_message(msg_id, user, message, member_status, timestamp)
-            if not success:
-                self.parent.log_status(f"Failed to add message to database: {msg_id}")
-                return False
-            return True
-        except Exception as e:
-            self.parent.log_status(f"Error processing message: {e}", exc_info=True)
-            self.parent.log_status(f"Error processing message: {e}")
-            return False
+    def process_message(self, record):
+        """Convert a pushed chat record into the tracker's message format."""
+        timestamp_usec = record.get("timestamp_usec")
+        author = record.get("author") or "Unknown"
+        platform = record.get("platform")
+        return {
+            "message_id": record["message_id"],
+            # YouTube names stay unprefixed for compatibility; other platforms get their own namespace
+            "user_id": f"{platform}:{author}" if platform else author,
+            "author": author,
+            "message": record.get("message") or "",
+            "is_member": "member" in (record.get("badges") or []),
+            "timestamp": int(timestamp_usec) / 1_000_000 if timestamp_usec else None,
+            "channel_id": record.get("channel_id"),
+        }
 
     def update_hotwords(self):
         try:
-            messages = []
-            all_messages = self.chat_tracker.get_all_messages(limit=100)
-            for _, _, message, _, _ in all_messages:
-                if message and message.strip():
-                    messages.append(message.strip())
-
-            if len(messages) < 30:
-                self.hotword_display.setText("HOT-WORDS: Not enough data")
-                self.parent.log_status("Not enough messages for hotword analysis")
+            now = time.time()
+            self.hot_messages.evict(now)
+            self.hot_tokens.evict(now)
+            counter = self.hot_tokens if self.words_checkbox.isChecked() else self.hot_messages
+            if len(counter) < 30:
+                if self.last_hotword != "":
+                    self.hotword_display.setText("HOT-WORDS: Not enough data")
+                    self.parent.log_status("Not enough messages for hotword analysis", logging.DEBUG)
+                    self.last_hotword, self.last_percent, self.last_top3 = "", None, None
                 return
 
             if self.top3_checkbox.isChecked():
-                top3 = analyze_top_messages(messages, top_n=3)
+                top3 = counter.top(top_n=3)
+                rounded = [(word, round(percent, 1)) for word, percent in top3]
+                if rounded == self.last_top3:
+                    return
+                self.last_top3, self.last_hotword, self.last_percent = rounded, None, None
                 if top3:
                     hot_words_text = "HOT-WORDS (TOP 3):\n"
                     for idx, (word, percent) in enumerate(top3):
                         hot_words_text += f"{idx + 1}. {word} ({percent:.1f}%)\n"
 
                     self.hotword_display.setText(hot_words_text)
-                    update_hotword_html(None, None, top3=top3)
-                    self.parent.log_status("Updated TOP 3 hotwords")
+                    self.overlay_server.publish(top3)
+                    self.parent.log_status("Updated TOP 3 hotwords", logging.DEBUG)
                 else:
                     self.hotword_display.setText("HOT-WORDS: N/A")
+                    self.overlay_server.publish([])
             else:
-                hotword, percent = analyze_hot_message(messages)
+                top = counter.top(top_n=1)
+                hotword, percent = top[0] if top else (None, 0.0)
+                if hotword == self.last_hotword and round(percent, 1) == self.last_percent:
+                    return
+                self.last_hotword, self.last_percent, self.last_top3 = hotword, round(percent, 1), None
                 if hotword:
                     self.hotword_display.setText(f"HOT-WORD:\n{hotword.upper()}\n{percent:.1f}%")
-                    update_hotword_html(hotword, percent)
+                    self.overlay_server.publish([(hotword, percent)])
                 else:
                     self.hotword_display.setText("HOT-WORD: N/A")
+                    self.overlay_server.publish([])
         except Exception as e:
             self.parent.log_status(f"Error updating hotwords: {e}")
-            self.parent.log_status(f"Error updating hotwords: {e}")
+
+    def on_settings_changed(self, settings):
+        if self.kick_settings(settings) != self.kick_settings(self.kick_started_with):
+            self.start_kick_chat(settings)
+        if (settings.get("chat_backend") or "browser") != self.chat_backend:
+            self.parent.log_status("Chat backend change takes effect after restarting the app")
+        self.live_watcher.configure(
+            settings.get("yt_channel", ""), settings.get("youtube_api", ""),
+            api_base=settings.get("youtube_api_base", ""),
+            daily_quota=int_setting(settings, "youtube_daily_quota", DEFAULT_DAILY_QUOTA))
+        max_messages = int_setting(settings, 'hotword_window_messages', 100)
+        max_age = int_setting(settings, 'hotword_window_seconds', 0, minimum=0)
+        if (max_messages, max_age) != (self.hot_messages.max_messages, self.hot_messages.max_age):
+            for counter in (self.hot_messages, self.hot_tokens):
+                counter.max_messages = max_messages
+                counter.max_age = max_age
+            self.update_hotwords()
+        ignored_spec = settings.get('ignored_users', '')
+        if ignored_spec != self.chat_tracker.ignored_users.spec:
+            purged = self.chat_tracker.set_ignored_users(ignored_spec)
+            self.ignored_label.setText(f"Ignored: {', '.join(self.chat_tracker.ignored_users.entries)}")
+            if purged:
+                self.parent.log_status(f"Removed {len(purged)} ignored users from the session")
 
     def load_settings(self):
         self.parent.log_status("Loading Youtube Watcher settings")
         try:
-            self.ignored_users = [user.strip() for user in self.parent.settings.get('ignored_users', '').split(',') if
-                                  user.strip()]
-            self.ignored_label.setText(f"Ignored: {', '.join(self.ignored_users)}")
-            youtube_api = self.parent.settings.get("youtube_api", "")
+            self.ignored_label.setText(f"Ignored: {', '.join(self.chat_tracker.ignored_users.entries)}")
             yt_channel = self.parent.settings.get("yt_channel", "")
-            self.parent.log_status(f"Checking live stream for channel: {yt_channel}")
+            self.parent.log_status(f"Watching live stream status for channel: {yt_channel}")
             self.parent.log_status("Resetting database for new session")
             self.chat_tracker.reset_database()
             self.seen_message_ids.clear()
+            self.hot_messages.clear()
+            self.hot_tokens.clear()
             self.message_count = 0
             self.message_count_label.setText("Messages: 0 added")
-            live_video_id = get_live_video_id(yt_channel, youtube_api)
-            if live_video_id:
-                self.parent.log_status(f"Live video found: {live_video_id}")
-                chat_url = "https://www.youtube.com/live_chat?v=" + live_video_id
-                self.parent.log_status("Loading chat URL: " + chat_url)
-                self.chat_view.setUrl(QtCore.QUrl(chat_url))
-                self.chat_view.loadFinished.connect(self.onChatLoadFinished)
-            else:
-                self.parent.log_status("No live video currently streaming")
         except Exception as e:
-            self.parent.log_status("Error while checking live status: " + str(e))
\ No newline at end of file
+            self.parent.log_status("Error while loading Youtube Watcher settings: " + str(e))
+
+    def on_live_changed(self, live_video_id):
+        """Attach the chat view to a newly started (or restarted) stream."""
+        if not live_video_id:
+            self.attached_video_id = None
+            if self.chat_backend == "http":
+                self.chat_poller.stop()
+                self.chat_status_label.setText("Headless chat: waiting for a live stream")
+            self.parent.log_status("No live video currently streaming")
+            return
+        if live_video_id == self.attached_video_id:
+            return
+        self.attached_video_id = live_video_id
+        self.parent.log_status(f"Live video found: {live_video_id}")
+        if self.chat_backend == "http":
+            self.parent.log_status(f"Polling live chat for {live_video_id}")
+            self.chat_status_label.setText(f"Headless chat: {live_video_id}")
+            self.chat_poller.start(live_video_id)
+            return
+        chat_url = "https://www.youtube.com/live_chat?v=" + live_video_id
+        self.parent.log_status("Loading chat URL: " + chat_url)
+        self.chat_view.setUrl(QtCore.QUrl(chat_url))
\ No newline at end of file
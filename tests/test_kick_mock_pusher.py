@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("PyQt5")
+websockets = pytest.importorskip("websockets")
+
+from tabs.kick_watcher.kick_chat import KickChatClient
+from tabs.kick_watcher.kick_mock_pusher import MockPusherServer
+
+CHATROOM_ID = 4242
+MESSAGES = [
+    {"author": "alice", "message": "hello [emote:37226:KEKW]"},
+    {"author": "bob", "message": "gg", "badges": ["subscriber"]},
+    {"author": "alice", "message": "spin"},
+]
+
+
+async def wait_until(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def receive_mock_chat():
+    mock = MockPusherServer(MESSAGES, rate=100, port=0)
+    async with websockets.serve(mock.handle, mock.host, 0) as ws_server:
+        mock.port = next(iter(ws_server.sockets)).getsockname()[1]
+        client = KickChatClient(str(CHATROOM_ID), mock.url)
+        client.loop = asyncio.get_running_loop()
+        client.stop_event = asyncio.Event()
+        received, statuses = [], []
+        client.messages_received.connect(received.extend)
+        client.status_changed.connect(statuses.append)
+
+        listener = asyncio.ensure_future(client.listen(CHATROOM_ID))
+        # Messages broadcast before the subscription would be dropped, so wait for it first.
+        await wait_until(lambda: statuses)
+        assert mock.subscribers and list(mock.subscribers.values()) == [CHATROOM_ID]
+        await mock.broadcast()
+        await wait_until(lambda: len(received) == len(MESSAGES))
+
+        client.stop_event.set()
+        await asyncio.wait_for(listener, 5)
+    return received, statuses
+
+
+def test_client_receives_mock_pusher_chat():
+    received, statuses = asyncio.run(receive_mock_chat())
+
+    assert statuses == [f"Kick chat connected: {CHATROOM_ID}"]
+    assert [(r["author"], r["message"]) for r in received] == [
+        ("alice", "hello KEKW"),
+        ("bob", "gg"),
+        ("alice", "spin"),
+    ]
+    assert all(r["platform"] == "kick" and r["message_id"].startswith("kick:") for r in received)
+    assert received[0]["channel_id"] == received[2]["channel_id"] != received[1]["channel_id"]
+    assert received[1]["badges"] == ["member"]
+    assert all(r["timestamp_usec"] for r in received)
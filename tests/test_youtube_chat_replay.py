@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("PyQt5")
+
+from tabs.youtube_watcher.youtube_chat_poller import ChatEnded, LiveChatPoller
+from tabs.youtube_watcher.youtube_chat_replay import (
+    REPLAY_API_KEY, REPLAY_CLIENT_VERSION, ChatReplay, ChatReplayServer,
+)
+
+MESSAGES = [
+    {"author": "alice", "message": "hello"},
+    {"author": "bob", "message": "gg", "badges": ["Member (2 months)"]},
+    {"author": "carol", "message": "free spins", "channel_id": "UCcarol"},
+]
+
+
+@pytest.fixture
+def replay_server():
+    server = ChatReplayServer(ChatReplay(MESSAGES, per_poll=2, poll_ms=750), port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_poller_reads_replayed_chat_until_it_ends(replay_server):
+    poller = LiveChatPoller(replay_server.web_base)
+
+    api_key, client_version, token, records = poller.bootstrap("replayVideo")
+    assert (api_key, client_version) == (REPLAY_API_KEY, REPLAY_CLIENT_VERSION)
+    assert token == "replay-2"
+    assert [(r["message_id"], r["author"], r["message"]) for r in records] == [
+        ("replay-1", "alice", "hello"),
+        ("replay-2", "bob", "gg"),
+    ]
+    assert records[0]["badges"] == []
+    assert records[1]["badges"] == ["member"]
+    assert records[0]["channel_id"].startswith("UCreplay")
+
+    token, delay, records = poller.fetch(api_key, client_version, token)
+    assert token == "replay-3"
+    assert delay == 0.75
+    assert [(r["message_id"], r["channel_id"], r["message"]) for r in records] == [
+        ("replay-3", "UCcarol", "free spins"),
+    ]
+
+    with pytest.raises(ChatEnded):
+        poller.fetch(api_key, client_version, token)
+    assert replay_server.replay.polls == 3
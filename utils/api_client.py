@@ -1,12 +1,109 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from PyQt5 import QtCore
+
+from utils.image_cache import get_image_cache
+
+logger = logging.getLogger('APIClient')
+
+# (connect, read) timeouts in seconds.
+DEFAULT_TIMEOUT = (3.05, 15)
+ENDPOINT_TIMEOUTS = {
+    "get-casinos": (3.05, 10),
+    "add-casino": (3.05, 60),
+    "add-users-points": (3.05, 30),
+}
+
+_session = None
+_executor = None
+_shared_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled session so every client reuses TCP/TLS connections."""
+    global _session
+    with _shared_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def get_executor():
+    global _executor
+    with _shared_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="APIClient")
+        return _executor
+
+
+def shutdown():
+    """Cancel queued requests and close pooled connections."""
+    global _session, _executor
+    with _shared_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class APIRequest:
+    """
+    Handle for a request running on the shared thread pool. Cancelling drops
+    the callback and, if the request has not started yet, the request itself.
+    """
+
+    def __init__(self, future):
+        self.future = future
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        return self.future.cancel()
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        return self.future.result(timeout)
+
+
+class _CallbackDispatcher(QtCore.QObject):
+    """Lives on the thread that created the client and runs request callbacks there."""
+
+    finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.finished.connect(self.deliver)
+
+    def deliver(self, payload):
+        request, callback, result = payload
+        if not request.cancelled:
+            callback(result)
+
 
 class APIClient:
     def __init__(self, settings):
         self.BASE_URL = settings.get('api_url', '')
+        self.session = get_session()
+        self.dispatcher = _CallbackDispatcher()
+
+    @staticmethod
+    def timeout_for(endpoint):
+        return ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
 
     def get_url(self, url, return_raw=False):
         try:
-            response = requests.get(f"{url}", stream=return_raw)
+            response = self.session.get(f"{url}", timeout=DEFAULT_TIMEOUT)
             response.raise_for_status()
 
             return response.content if return_raw else response.json()
@@ -15,9 +112,13 @@ class APIClient:
             print(f"GET Error: {e}")
             return None
 
+    def get_image(self, url):
+        """Fetch an image through the shared on-disk cache; returns (content, modified)."""
+        return get_image_cache().fetch(url, self.session, timeout=DEFAULT_TIMEOUT)
+
     def get(self, endpoint, return_raw=False):
         try:
-            response = requests.get(f"{self.BASE_URL}{endpoint}", stream=return_raw)
+            response = self.session.get(f"{self.BASE_URL}{endpoint}", timeout=self.timeout_for(endpoint))
             response.raise_for_status()
 
             return response.content if return_raw else response.json()
@@ -26,12 +127,14 @@ class APIClient:
             print(f"GET Error: {e}")
             return None
 
-    def post(self, endpoint, data=None, files=None, json=None):
+    def post(self, endpoint, data=None, files=None, json=None, headers=None):
         try:
+            url = f"{self.BASE_URL}{endpoint}"
+            timeout = self.timeout_for(endpoint)
             if json:
-                response = requests.post(f"{self.BASE_URL}{endpoint}", json=json, files=files)
+                response = self.session.post(url, json=json, files=files, headers=headers, timeout=timeout)
             else:
-                response = requests.post(f"{self.BASE_URL}{endpoint}", data=data, files=files)
+                response = self.session.post(url, data=data, files=files, headers=headers, timeout=timeout)
 
             response.raise_for_status()
             return response.json() if response.content else {"error": "Empty response from server"}
@@ -41,9 +144,46 @@ class APIClient:
 
     def patch(self, endpoint, data):
         try:
-            response = requests.patch(f"{self.BASE_URL}{endpoint}", json=data)
+            response = self.session.patch(f"{self.BASE_URL}{endpoint}", json=data, timeout=self.timeout_for(endpoint))
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             print(f"PATCH Error: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def submit(self, fn, *args, callback=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) on the shared thread pool. If a callback is given
+        it is called with the result on the thread that created this client.
+        """
+        future = get_executor().submit(fn, *args, **kwargs)
+        request = APIRequest(future)
+        if callback is not None:
+            def on_done(done_future):
+                if done_future.cancelled():
+                    return
+                try:
+                    result = done_future.result()
+                except Exception as e:
+                    logger.error(f"Background request failed: {e}", exc_info=True)
+                    result = None
+                self.dispatcher.finished.emit((request, callback, result))
+
+            future.add_done_callback(on_done)
+        return request
+
+    def get_url_async(self, url, return_raw=False, callback=None):
+        return self.submit(self.get_url, url, return_raw, callback=callback)
+
+    def get_image_async(self, url, callback=None):
+        return self.submit(self.get_image, url, callback=callback)
+
+    def get_async(self, endpoint, return_raw=False, callback=None):
+        return self.submit(self.get, endpoint, return_raw, callback=callback)
+
+    def post_async(self, endpoint, data=None, files=None, json=None, headers=None, callback=None):
+        return self.submit(self.post, endpoint, data=data, files=files, json=json, headers=headers,
+                           callback=callback)
+
+    def patch_async(self, endpoint, data, callback=None):
+        return self.submit(self.patch, endpoint, data, callback=callback)
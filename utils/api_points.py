@@ -1,31 +1,93 @@
+import gzip
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from utils.api_client import APIClient
+from utils.metrics import METRICS
 
 logger = logging.getLogger('APIPoints')
 
-def award_points(user_ids, points, streamer_id, api_client):
-    if not user_ids:
-        logger.info("No users to award points")
-        return False
+POINTS_ENDPOINT = "add-users-points"
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_UPLOAD_WORKERS = 4
+
+
+def chunk_users(user_ids, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split users into sorted, fixed-size chunks. Sorting makes the split
+    deterministic, so the users of failed chunks re-chunk into the same chunks
+    (and the same idempotency keys) on retry.
+    """
+    users = sorted(user_ids)
+    chunk_size = max(1, int(chunk_size))
+    return [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
 
+
+def chunk_key(idempotency_key, chunk):
+    digest = hashlib.sha1("\n".join(chunk).encode("utf-8")).hexdigest()[:16]
+    return f"{idempotency_key}-{digest}"
+
+
+def post_points_chunk(chunk, points, streamer_id, api_client, idempotency_key=None, compress=False):
     data = {
         "streamer_id": streamer_id,
-        "users": user_ids,
+        "users": chunk,
         "points": points
     }
+    headers = {"Content-Type": "application/json"}
+    if compress:
+        # Only for backends that decompress request bodies; others reject every award.
+        headers["Content-Encoding"] = "gzip"
+    if idempotency_key:
+        data["idempotency_key"] = idempotency_key
+        headers["Idempotency-Key"] = idempotency_key
 
-    logger.info(f"Awarding {points} points to {len(user_ids)} users")
     try:
-        endpoint = "add-users-points"
-        response = api_client.post(endpoint, json=data)
+        body = json.dumps(data).encode("utf-8")
+        if compress:
+            body = gzip.compress(body)
+        with METRICS.timed("award_points_http", len(chunk)):
+            response = api_client.post(POINTS_ENDPOINT, data=body, headers=headers)
 
         if response and "error" not in response:
-            logger.info(f"Successfully awarded points. Response: {response}")
             return True
-        else:
-            error_message = response.get("error", "Unknown error") if response else "Empty response"
-            logger.error(f"Failed to award points. Error: {error_message}")
-            return False
+        error_message = response.get("error", "Unknown error") if response else "Empty response"
+        logger.error(f"Failed to award points to a chunk of {len(chunk)} users. Error: {error_message}")
+        return False
     except Exception as e:
         logger.error(f"API request error when awarding points: {e}", exc_info=True)
-        return False
\ No newline at end of file
+        return False
+
+
+def award_points_chunked(user_ids, points, streamer_id, api_client, idempotency_key=None,
+                         chunk_size=DEFAULT_CHUNK_SIZE, max_workers=DEFAULT_UPLOAD_WORKERS, compress=False):
+    """
+    Award points in chunks uploaded concurrently by at most max_workers
+    threads, gzip-compressed when ``compress`` is set. Returns the users whose chunk failed, so callers can
+    retry only those; an empty list means every chunk was accepted.
+    """
+    if not user_ids:
+        logger.info("No users to award points")
+        return []
+
+    chunks = chunk_users(user_ids, chunk_size)
+    keys = [chunk_key(idempotency_key, chunk) if idempotency_key else None for chunk in chunks]
+    logger.info(f"Awarding {points} points to {len(user_ids)} users in {len(chunks)} chunks")
+
+    if len(chunks) == 1:
+        results = [post_points_chunk(chunks[0], points, streamer_id, api_client, keys[0], compress)]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(chunks))),
+                                thread_name_prefix="PointsUpload") as executor:
+            results = list(executor.map(
+                lambda args: post_points_chunk(args[0], points, streamer_id, api_client, args[1], compress),
+                zip(chunks, keys)
+            ))
+
+    failed = [user_id for chunk, ok in zip(chunks, results) if not ok for user_id in chunk]
+    if failed:
+        logger.error(f"{results.count(False)} of {len(chunks)} point chunks failed ({len(failed)} users)")
+    else:
+        logger.info(f"Successfully awarded points to {len(user_ids)} users")
+    return failed
@@ -0,0 +1,77 @@
+import logging
+import time
+
+from PyQt5 import QtCore
+
+logger = logging.getLogger('CasinoCatalog')
+
+DEFAULT_TTL = 300
+
+
+class CasinoCatalog(QtCore.QObject):
+    """
+    Shared in-memory copy of the ``get-casinos`` list. Only one fetch is in
+    flight at a time: refreshes requested while one is running join it instead
+    of starting another, and refreshes within the TTL are answered from memory.
+    Tabs listen on ``changed`` rather than fetching the list themselves. A
+    forced refresh always emits ``changed``, even if the list is unchanged, so
+    a manual refresh is visibly answered.
+    """
+
+    changed = QtCore.pyqtSignal(list)
+    fetch_failed = QtCore.pyqtSignal()
+
+    def __init__(self, api_client, ttl=DEFAULT_TTL, parent=None):
+        super().__init__(parent)
+        self.api_client = api_client
+        self.ttl = ttl
+        self.casinos = []
+        self.by_name = {}
+        self.fetched_at = None
+        self.request = None
+        self.refetch = False
+        self.forced = False
+
+    def is_fresh(self):
+        return self.fetched_at is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    def get(self, name):
+        return self.by_name.get(name)
+
+    def refresh(self, force=False):
+        """Fetch the list unless a fresh copy is held or a fetch is already running."""
+        if force:
+            self.forced = True
+        if self.request is not None:
+            return
+        if not force and self.is_fresh():
+            return
+        self.request = self.api_client.get_async("get-casinos", callback=self.on_loaded)
+
+    def invalidate(self):
+        """Drop the cached list; a fetch already in flight may predate the change, so fetch again after it."""
+        self.fetched_at = None
+        if self.request is not None:
+            self.refetch = True
+        self.refresh()
+
+    def on_loaded(self, response):
+        self.request = None
+        forced, self.forced = self.forced, False
+        if self.refetch:
+            self.refetch = False
+            self.refresh(force=True)
+        if not response or "casinos" not in response:
+            logger.error("Unable to fetch casinos from API")
+            self.fetch_failed.emit()
+            return
+
+        casinos = response["casinos"]
+        self.fetched_at = time.monotonic()
+        if casinos == self.casinos and not forced:
+            return
+        if casinos != self.casinos:
+            self.casinos = casinos
+            self.by_name = {casino.get("name"): casino for casino in casinos}
+            logger.info(f"Casino catalog updated ({len(casinos)} casinos)")
+        self.changed.emit(casinos)
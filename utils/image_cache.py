@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import requests
+
+logger = logging.getLogger('ImageCache')
+
+CACHE_DIR = "image_cache"
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_image_cache():
+    """Return the process-wide image cache shared by every tab."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ImageCache()
+        return _cache
+
+
+class ImageCache:
+    """
+    On-disk cache for remote images. Image bytes are stored once per content
+    hash under ``blobs/``; ``index.json`` maps each URL to its hash and the
+    ETag/Last-Modified validators from the last response, so revalidation is a
+    conditional request that normally comes back as 304 with no body.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.lock = threading.Lock()
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.index = self.load_index()
+
+    def load_index(self):
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error reading image cache index, starting empty: {e}")
+            return {}
+
+    def save_index(self):
+        tmp_file = self.index_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_file, self.index_file)
+
+    def blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest)
+
+    def cached(self, url):
+        """Return the cached bytes for url without touching the network, or None."""
+        with self.lock:
+            entry = self.index.get(url)
+        if not entry:
+            return None
+        try:
+            with open(self.blob_path(entry["sha256"]), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url, content, etag=None, last_modified=None):
+        digest = hashlib.sha256(content).hexdigest()
+        path = self.blob_path(digest)
+        if not os.path.exists(path):
+            tmp_file = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(content)
+            os.replace(tmp_file, path)
+        entry = {"sha256": digest, "etag": etag, "last_modified": last_modified}
+        with self.lock:
+            if self.index.get(url) != entry:
+                self.index[url] = entry
+                self.save_index()
+
+    def fetch(self, url, session, timeout=None):
+        """
+        Revalidate url and return (content, modified). ``modified`` is False when
+        the cached copy is still current. If the server is unreachable the
+        cached copy is returned as unmodified; with no cached copy the result is
+        (None, False).
+        """
+        with self.lock:
+            entry = dict(self.index.get(url) or {})
+        cached = self.cached(url) if entry else None
+
+        headers = {}
+        if cached is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304 and cached is not None:
+                return cached, False
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Image fetch failed for {url}: {e}")
+            return cached, False
+
+        content = response.content
+        if cached is not None and hashlib.sha256(content).hexdigest() == entry.get("sha256"):
+            modified = False
+        else:
+            modified = True
+        self.store(url, content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return content, modified
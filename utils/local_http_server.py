@@ -0,0 +1,52 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger('LocalHTTPServer')
+
+
+class LocalRequestHandler(BaseHTTPRequestHandler):
+    """
+    Base handler for LocalHTTPServer. The owning server object is available as
+    ``self.server.owner``; access logs go to the subclass's ``logger`` at debug level.
+    """
+
+    logger = logger
+
+    def log_message(self, format, *args):
+        self.logger.debug("%s - " + format, self.address_string(), *args)
+
+
+class LocalHTTPServer:
+    """
+    A ThreadingHTTPServer on a daemon thread, bound to host:port. Port 0 picks
+    a free port, which is read back after ``start``. Subclasses set
+    ``handler_class`` and ``thread_name`` and add their own state.
+    """
+
+    handler_class = LocalRequestHandler
+    thread_name = "LocalHTTPServer"
+
+    def __init__(self, port, host="127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self.handler_class)
+        self.httpd.daemon_threads = True
+        self.httpd.owner = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name=self.thread_name, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
@@ -1,13 +1,147 @@
-from PyQt5 import QtWidgets
+import heapq
+import itertools
+import logging
+from collections import deque
+
+from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import QDateTime
 
+MAX_LINES = 2000
+FLUSH_INTERVAL_MS = 100
+LEVEL_FILTERS = (
+    ("Debug", logging.DEBUG),
+    ("Info", logging.INFO),
+    ("Warnings", logging.WARNING),
+    ("Errors", logging.ERROR),
+)
+
+
+class LogEntry:
+    __slots__ = ("seq", "timestamp", "level", "message", "count")
+
+    def __init__(self, seq, timestamp, level, message):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+        self.count = 1
+
+    def text(self):
+        level = "" if self.level == logging.INFO else f"{logging.getLevelName(self.level)}: "
+        repeat = f" (x{self.count})" if self.count > 1 else ""
+        return f"[{self.timestamp}] {level}{self.message}{repeat}"
+
+
+class Logger(QtWidgets.QWidget):
+    """
+    Status pane. Entries are kept in one ring buffer of MAX_LINES per
+    selectable level, so chatty debug output cannot push warnings and errors
+    out of the history, and are appended to the view at most once per
+    FLUSH_INTERVAL_MS; a message identical to the previous one only bumps its
+    repeat count. The level selector hides entries below the chosen severity.
+    """
 
-class Logger(QtWidgets.QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setReadOnly(True)
         self.setFixedHeight(100)
+        self.rings = {level: deque(maxlen=MAX_LINES) for _, level in LEVEL_FILTERS}
+        self.sequence = itertools.count()
+        self.last_entry = None
+        self.pending = []
+        self.min_level = logging.INFO
+        # The entry on the view's last line, and whether that line needs rewriting
+        # because its repeat count changed.
+        self.last_shown = None
+        self.last_dirty = False
+
+        self.view = QtWidgets.QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(MAX_LINES)
+        self.view.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+
+        self.level_selector = QtWidgets.QComboBox()
+        for name, level in LEVEL_FILTERS:
+            self.level_selector.addItem(name, level)
+        self.level_selector.setCurrentIndex(1)
+        self.level_selector.currentIndexChanged.connect(self.on_level_changed)
 
-    def append_message(self, message):
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view)
+        layout.addWidget(self.level_selector, 0, QtCore.Qt.AlignTop)
+
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    @staticmethod
+    def infer_level(message):
+        head = message.lower().split(":", 1)[0]
+        if "error" in head or "failed" in head:
+            return logging.ERROR
+        return logging.INFO
+
+    def append_message(self, message, level=None):
+        if level is None:
+            level = self.infer_level(message)
+        self.pending.append((level, message))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
         timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.append(f"[{timestamp}] {message}")
+        pending, self.pending = self.pending, []
+        new_lines = []
+        for level, message in pending:
+            last = self.last_entry
+            if last is not None and last.level == level and last.message == message:
+                last.count += 1
+                last.timestamp = timestamp
+                if last.level >= self.min_level:
+                    if new_lines and new_lines[-1] is last:
+                        continue
+                    self.last_dirty = True
+                continue
+            entry = LogEntry(next(self.sequence), timestamp, level, message)
+            self.rings[self.ring_level(level)].append(entry)
+            self.last_entry = entry
+            if level >= self.min_level:
+                new_lines.append(entry)
+
+        if self.last_dirty:
+            self.replace_last_line(self.last_shown.text())
+            self.last_dirty = False
+        if new_lines:
+            self.view.appendPlainText("\n".join(entry.text() for entry in new_lines))
+            self.last_shown = new_lines[-1]
+
+    def replace_last_line(self, text):
+        cursor = self.view.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.movePosition(QtGui.QTextCursor.StartOfBlock, QtGui.QTextCursor.KeepAnchor)
+        cursor.insertText(text)
+        self.view.verticalScrollBar().setValue(self.view.verticalScrollBar().maximum())
+
+    @staticmethod
+    def ring_level(level):
+        """The selectable level whose ring holds entries of this level."""
+        ring = LEVEL_FILTERS[0][1]
+        for _, filter_level in LEVEL_FILTERS:
+            if level >= filter_level:
+                ring = filter_level
+        return ring
+
+    def entries_from(self, min_level):
+        """The newest MAX_LINES entries at or above min_level, oldest first."""
+        rings = [ring for level, ring in self.rings.items() if level >= min_level]
+        return list(heapq.merge(*rings, key=lambda entry: entry.seq))[-MAX_LINES:]
+
+    def on_level_changed(self, index):
+        self.flush()
+        self.min_level = self.level_selector.itemData(index)
+        shown = self.entries_from(self.min_level)
+        self.view.setPlainText("\n".join(entry.text() for entry in shown))
+        self.view.verticalScrollBar().setValue(self.view.verticalScrollBar().maximum())
+        self.last_shown = shown[-1] if shown else None
+        self.last_dirty = False
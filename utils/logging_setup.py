@@ -0,0 +1,55 @@
+import logging
+import logging.handlers
+import os
+import queue
+
+LOG_FILE = "youtube_helper.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_LEVEL = "INFO"
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+_listener = None
+
+
+def configure_logging(level=DEFAULT_LEVEL, log_file=LOG_FILE, max_bytes=MAX_BYTES, backup_count=BACKUP_COUNT):
+    """
+    Route all logging through a QueueHandler so callers only enqueue records;
+    a QueueListener thread formats them and writes to a size-rotated file.
+    The previous session's log is rolled over to ``<log_file>.1`` on start.
+    """
+    global _listener
+    if _listener is not None:
+        set_log_level(level)
+        return
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    if os.path.exists(log_file) and os.path.getsize(log_file) > 0:
+        file_handler.doRollover()
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    set_log_level(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def set_log_level(level):
+    """Change the root level at runtime; unknown names fall back to the default."""
+    level = (level or DEFAULT_LEVEL).upper()
+    if level not in LOG_LEVELS:
+        level = DEFAULT_LEVEL
+    logging.getLogger().setLevel(level)
+
+
+def shutdown_logging():
+    """Flush queued records to disk and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,154 @@
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.local_http_server import LocalHTTPServer, LocalRequestHandler
+
+logger = logging.getLogger('Metrics')
+
+DEFAULT_METRICS_PORT = 9464
+# Latency bucket upper bounds in seconds.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Pipeline stages in the order a chat message passes through them.
+STAGES = (
+    ("js_extraction", "DOM observed to Python receipt"),
+    ("payload_parse", "Chat payload parsing"),
+    ("dedup", "Message-id dedup"),
+    ("db_write", "SQLite batch write"),
+    ("hotword_analysis", "Hot-word counting and ranking"),
+    ("overlay_render", "Overlay delta publish"),
+    ("award_points_http", "award_points HTTP request"),
+)
+
+
+class StageMetrics:
+    """Latency histogram plus item counter for one pipeline stage."""
+
+    def __init__(self, name, description=""):
+        self.name = name
+        self.description = description
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.items = 0
+
+    def observe(self, seconds, items=1):
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.items += items
+
+    def quantile(self, q):
+        """Estimate the q-quantile in seconds from the buckets (upper bound of the bucket it falls in)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return BUCKETS[index] if index < len(BUCKETS) else float("inf")
+        return float("inf")
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of per-stage metrics. Stages record each run with
+    ``observe`` or the ``timed`` context manager; ``items`` counts the
+    messages or users the run handled so rates can be derived.
+    """
+
+    def __init__(self, stages=STAGES):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.stages = {name: StageMetrics(name, description) for name, description in stages}
+
+    def stage(self, name):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = StageMetrics(name)
+        return stage
+
+    def observe(self, name, seconds, items=1):
+        with self.lock:
+            self.stage(name).observe(seconds, items)
+
+    @contextmanager
+    def timed(self, name, items=1):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, items)
+
+    def snapshot(self):
+        """Return {name: (count, items, total_seconds, p50, p95, p99)} for the diagnostics view."""
+        with self.lock:
+            return {
+                name: (stage.count, stage.items, stage.total_seconds,
+                       stage.quantile(0.5), stage.quantile(0.95), stage.quantile(0.99))
+                for name, stage in self.stages.items()
+            }
+
+    def render_prometheus(self):
+        lines = []
+        with self.lock:
+            lines.append("# HELP chat_pipeline_stage_seconds Time spent per run of each pipeline stage.")
+            lines.append("# TYPE chat_pipeline_stage_seconds histogram")
+            for name, stage in self.stages.items():
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKETS, stage.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f'chat_pipeline_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'chat_pipeline_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {stage.count}')
+                lines.append(f'chat_pipeline_stage_seconds_sum{{stage="{name}"}} {stage.total_seconds:.6f}')
+                lines.append(f'chat_pipeline_stage_seconds_count{{stage="{name}"}} {stage.count}')
+            lines.append("# HELP chat_pipeline_stage_items_total Messages or users handled by each stage.")
+            lines.append("# TYPE chat_pipeline_stage_items_total counter")
+            for name, stage in self.stages.items():
+                lines.append(f'chat_pipeline_stage_items_total{{stage="{name}"}} {stage.items}')
+        lines.append("# HELP process_uptime_seconds Seconds since metrics were initialised.")
+        lines.append("# TYPE process_uptime_seconds gauge")
+        lines.append(f"process_uptime_seconds {time.monotonic() - self.started:.1f}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+class MetricsRequestHandler(LocalRequestHandler):
+    logger = logger
+    server_version = "ChatMetrics/1.0"
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.owner.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MetricsServer(LocalHTTPServer):
+    """Serves the registry in Prometheus text format at http://host:port/metrics."""
+
+    handler_class = MetricsRequestHandler
+    thread_name = "MetricsServer"
+
+    def __init__(self, registry=METRICS, port=DEFAULT_METRICS_PORT, host="127.0.0.1"):
+        super().__init__(port, host)
+        self.registry = registry
+
+    @property
+    def url(self):
+        return f"{self.base_url}/metrics"
+
+    def start(self):
+        super().start()
+        logger.info(f"Metrics served at {self.url}")
@@ -0,0 +1,188 @@
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import uuid
+
+from utils.api_points import DEFAULT_CHUNK_SIZE, DEFAULT_UPLOAD_WORKERS, award_points_chunked
+
+logger = logging.getLogger('PointsOutbox')
+OUTBOX_FILE = "points_outbox.db"
+STOP_TIMEOUT = 1.0
+
+
+def coalesce_batches(points, user_ids, new_points, new_user_ids):
+    """
+    Combine two award batches into one (points, users) batch, or return None
+    when that would change what anyone receives.
+    """
+    existing = set(user_ids)
+    if existing == set(new_user_ids):
+        return points + new_points, user_ids
+    if points == new_points and existing.isdisjoint(new_user_ids):
+        return points, user_ids + new_user_ids
+    return None
+
+
+class PointsOutbox:
+    """
+    Durable queue of point awards. Batches are stored in SQLite with an
+    idempotency key before any delivery attempt, so they survive backend
+    outages and restarts. A worker thread delivers due batches and reschedules
+    failures with capped exponential backoff and full jitter. Large batches
+    are uploaded in chunks; when only some chunks fail, the batch is narrowed
+    to the users of those chunks so retries never resend accepted ones.
+
+    While a batch is backing off, newly queued batches wait for its retry
+    rather than failing straight away, and each is coalesced into the
+    waiting batch before it when that loses no points: the same users get
+    the points added together, and disjoint users at the same points are
+    combined into one batch.
+
+    ``on_result(success, user_count, points, interval_key)`` is called from the
+    worker thread after every delivery attempt.
+    """
+
+    def __init__(self, api_client, db_file=OUTBOX_FILE, base_delay=2.0, max_delay=300.0, on_result=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, upload_workers=DEFAULT_UPLOAD_WORKERS, compress=False):
+        self.api_client = api_client
+        self.chunk_size = chunk_size
+        self.upload_workers = upload_workers
+        self.compress = compress
+        self.db_file = db_file
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_result = on_result
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.in_flight = None
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                interval_key TEXT NOT NULL,
+                streamer_id TEXT,
+                points INTEGER NOT NULL,
+                users TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (next_attempt_at);
+        """)
+        self.thread = threading.Thread(target=self.run, name="PointsOutbox", daemon=True)
+
+    def start(self):
+        pending = self.pending_count()
+        if pending:
+            logger.info(f"Resuming delivery of {pending} queued point batches")
+        self.thread.start()
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """
+        Stop the worker, waiting at most ``timeout`` seconds for a delivery in
+        flight. Batches are durable, so one still sending when the app exits is
+        simply resent under the same idempotency key on the next start.
+        """
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            logger.info("Leaving a point delivery in flight; it will be retried on the next start")
+            return
+        with self.lock:
+            self.conn.close()
+
+    def pending_count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def enqueue(self, user_ids, points, streamer_id, interval_key):
+        """Store an award batch, coalescing it into the latest batch still waiting for its first attempt."""
+        now = time.time()
+        user_ids = list(dict.fromkeys(user_ids))
+        with self.lock, self.conn:
+            retry_at = self.conn.execute("SELECT MIN(next_attempt_at) FROM outbox WHERE attempts > 0").fetchone()[0]
+            next_attempt_at = max(now, retry_at or now)
+            # Attempted batches may already be applied under their idempotency key, and the
+            # in-flight one is being sent, so only never-attempted batches are merge candidates.
+            row = self.conn.execute(
+                "SELECT id, points, users FROM outbox WHERE attempts = 0 AND streamer_id IS ? AND id IS NOT ? "
+                "ORDER BY id DESC LIMIT 1",
+                (streamer_id, self.in_flight)
+            ).fetchone()
+            merged = coalesce_batches(row[1], json.loads(row[2]), points, user_ids) if row else None
+            if merged:
+                merged_points, merged_users = merged
+                self.conn.execute(
+                    "UPDATE outbox SET idempotency_key = ?, interval_key = ?, points = ?, users = ? WHERE id = ?",
+                    (uuid.uuid4().hex, interval_key, merged_points, json.dumps(merged_users), row[0])
+                )
+                logger.info(f"Coalesced {len(user_ids)} users ({interval_key}) into a queued point batch")
+            else:
+                self.conn.execute(
+                    "INSERT INTO outbox (idempotency_key, interval_key, streamer_id, points, users, "
+                    "next_attempt_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (uuid.uuid4().hex, interval_key, streamer_id, points, json.dumps(user_ids),
+                     next_attempt_at, now)
+                )
+        self.wake.set()
+
+    def next_due(self, now):
+        with self.lock:
+            batch = self.conn.execute(
+                "SELECT id, idempotency_key, interval_key, streamer_id, points, users, attempts FROM outbox "
+                "WHERE next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT 1",
+                (now,)
+            ).fetchone()
+            self.in_flight = batch[0] if batch else None
+            return batch
+
+    def seconds_until_next_due(self, now):
+        with self.lock:
+            next_attempt_at = self.conn.execute("SELECT MIN(next_attempt_at) FROM outbox").fetchone()[0]
+        return None if next_attempt_at is None else max(0.0, next_attempt_at - now)
+
+    def backoff_delay(self, attempts):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempts)))
+
+    def run(self):
+        while not self.stopping:
+            now = time.time()
+            batch = self.next_due(now)
+            if batch is None:
+                self.wake.wait(self.seconds_until_next_due(now))
+                self.wake.clear()
+                continue
+            self.deliver(batch)
+
+    def deliver(self, batch):
+        batch_id, idempotency_key, interval_key, streamer_id, points, users_json, attempts = batch
+        user_ids = json.loads(users_json)
+        failed = award_points_chunked(user_ids, points, streamer_id, self.api_client, idempotency_key,
+                                      self.chunk_size, self.upload_workers, self.compress)
+        with self.lock, self.conn:
+            if not failed:
+                self.conn.execute("DELETE FROM outbox WHERE id = ?", (batch_id,))
+            else:
+                delay = self.backoff_delay(attempts + 1)
+                self.conn.execute(
+                    "UPDATE outbox SET users = ?, attempts = attempts + 1, next_attempt_at = ?, last_error = ? "
+                    "WHERE id = ?",
+                    (json.dumps(failed), time.time() + delay,
+                     f"{len(failed)} of {len(user_ids)} users failed", batch_id)
+                )
+                logger.warning(f"Point batch {idempotency_key} failed for {len(failed)} of {len(user_ids)} users "
+                               f"(attempt {attempts + 1}), retrying in {delay:.1f}s")
+            self.in_flight = None
+        if self.on_result:
+            delivered = len(user_ids) - len(failed)
+            if delivered and failed:
+                self.on_result(True, delivered, points, interval_key)
+            self.on_result(not failed, len(failed) or len(user_ids), points, interval_key)
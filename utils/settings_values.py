@@ -0,0 +1,23 @@
+import logging
+
+logger = logging.getLogger('Settings')
+
+
+def int_setting(settings, key, default, minimum=1, maximum=None):
+    """
+    Read a free-text integer setting. Blank values give ``default``; values
+    that do not parse or fall outside [minimum, maximum] are logged and also
+    give ``default``, so a typo never raises out of a settings slot.
+    """
+    raw = str(settings.get(key) or "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {key} setting {raw!r}, using {default}")
+        return default
+    if value < minimum or (maximum is not None and value > maximum):
+        logger.warning(f"Ignoring out-of-range {key} setting {value}, using {default}")
+        return default
+    return value
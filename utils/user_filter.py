@@ -0,0 +1,49 @@
+import re
+
+CHANNEL_ID_PATTERN = re.compile(r"^UC[0-9A-Za-z_-]{22}$")
+
+
+def normalize_name(name):
+    return name.strip().lstrip("@").casefold()
+
+
+def wildcard_to_regex(pattern):
+    """Translate ``*`` and ``?`` to regex; every other character, "[" included, matches literally."""
+    parts = [".*" if char == "*" else "." if char == "?" else re.escape(char) for char in pattern]
+    return f"(?s:{''.join(parts)})\\Z"
+
+
+class IgnoredUsersMatcher:
+    """
+    Compiled form of the comma separated ``ignored_users`` setting.
+
+    Entries match display names case-insensitively (a leading "@" is ignored)
+    and may use ``*``/``?`` wildcards. Entries shaped like a YouTube channel ID
+    match the author's channel ID instead of the display name.
+    """
+
+    def __init__(self, spec=""):
+        self.spec = spec or ""
+        self.entries = [entry.strip() for entry in self.spec.split(",") if entry.strip()]
+        self.names = set()
+        self.channel_ids = set()
+        patterns = []
+        for entry in self.entries:
+            if CHANNEL_ID_PATTERN.match(entry):
+                self.channel_ids.add(entry)
+            elif "*" in entry or "?" in entry:
+                patterns.append(wildcard_to_regex(normalize_name(entry)))
+            else:
+                self.names.add(normalize_name(entry))
+        self.pattern = re.compile("|".join(patterns)) if patterns else None
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    def matches(self, user_id, channel_id=None):
+        if channel_id and channel_id in self.channel_ids:
+            return True
+        if not user_id:
+            return False
+        name = normalize_name(user_id)
+        return name in self.names or (self.pattern is not None and self.pattern.match(name) is not None)